@@ -1,46 +1,155 @@
-import django_rq
+import json
+import logging
+
+from asgiref.sync import sync_to_async
 from django.http import HttpRequest, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from langchain_google_genai._common import GoogleGenerativeAIError
 from rest_framework import status
-from rest_framework.response import Response
-from rest_framework.views import APIView
-from rq.job import Job
 
-from arbitrage_agent.core.logic import ask_agent
+from arbitrage_agent.apps.news_articles.models import StandingQuery
+from arbitrage_agent.apps.news_articles.percolator import register_standing_query
+from arbitrage_agent.apps.transcripts.utils import aget_transcript_page
+from arbitrage_agent.core.jobs import afetch_job_statuses, submit_analysis
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on task ids accepted by a single batched status request
+MAX_STATUS_BATCH_SIZE = 100
+DEFAULT_TRANSCRIPT_PAGE_SIZE = 20
+MAX_TRANSCRIPT_PAGE_SIZE = 100
 
 
-class StartAnalysisView(APIView):
-    def post(self, request: HttpRequest) -> Response:
-        user_query = request.data.get("query")
-        if not user_query:
+@method_decorator(csrf_exempt, name="dispatch")
+class StartAnalysisView(View):
+    async def post(self, request: HttpRequest) -> JsonResponse:
+        try:
+            payload = json.loads(request.body or b"{}")
+        except json.JSONDecodeError:
+            payload = request.POST
+
+        user_query = payload.get("query") if isinstance(payload, dict) else None
+        if not user_query or not isinstance(user_query, str):
             return JsonResponse({"error": "Query is required"}, status=status.HTTP_400_BAD_REQUEST)
 
-        job = ask_agent.delay(user_query)
+        idempotency_key = request.headers.get("Idempotency-Key")
+        # RQ enqueueing is synchronous; run it off the event loop without pinning every request to one thread
+        job, created = await sync_to_async(submit_analysis, thread_sensitive=False)(
+            user_query, idempotency_key=idempotency_key
+        )
+        if not created:
+            return JsonResponse({
+                "task_id": job.id,
+                "status": job.get_status(refresh=False),
+                "message": "Identical analysis already submitted."
+            })
+
         return JsonResponse({
             "task_id": job.id,
             "status": "queued",
             "message": "Analysis started."
         })
 
-class TaskStatusView(APIView):
-    def get(self, request: HttpRequest, task_id: str) -> Response:
-        redis_conn = django_rq.get_connection('default')
 
-        try:
-            job = Job.fetch(task_id, connection=redis_conn)
-        except Exception:
+class TaskStatusView(View):
+    async def get(self, request: HttpRequest, task_id: str) -> JsonResponse:
+        if request.GET.get("view") == "transcript":
+            return await self.get_transcript(request, task_id)
+
+        statuses = await afetch_job_statuses([task_id])
+        job_status = statuses[task_id]
+        if job_status is None:
             return JsonResponse({"status": "error", "message": "Job not found"}, status=404)
 
-        if job.is_finished:
-            return JsonResponse({
-                "status": "completed",
-                "data": job.result
-            })
-        elif job.is_failed:
-            return JsonResponse({
-                "status": "failed",
-                "error": str(job.exc_info)
-            })
-        else:
-            return JsonResponse({
-                "status": job.get_status(),
-            })
+        return JsonResponse(job_status)
+
+    async def get_transcript(self, request: HttpRequest, task_id: str) -> JsonResponse:
+        try:
+            page = max(int(request.GET.get("page", 1)), 1)
+            page_size = min(max(int(request.GET.get("page_size", DEFAULT_TRANSCRIPT_PAGE_SIZE)), 1),
+                            MAX_TRANSCRIPT_PAGE_SIZE)
+        except ValueError:
+            return JsonResponse({"error": "page and page_size must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+
+        transcript = await aget_transcript_page(task_id, page, page_size)
+        if transcript is None:
+            return JsonResponse({"status": "error", "message": "Transcript not found"}, status=404)
+
+        return JsonResponse(transcript)
+
+
+class BatchTaskStatusView(View):
+    async def get(self, request: HttpRequest) -> JsonResponse:
+        task_ids = [task_id for task_id in request.GET.get("task_ids", "").split(",") if task_id]
+        if not task_ids:
+            return JsonResponse({"error": "task_ids is required"}, status=status.HTTP_400_BAD_REQUEST)
+        if len(task_ids) > MAX_STATUS_BATCH_SIZE:
+            return JsonResponse(
+                {"error": f"At most {MAX_STATUS_BATCH_SIZE} task ids per request"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        statuses = await afetch_job_statuses(list(dict.fromkeys(task_ids)))
+        return JsonResponse({
+            "results": {
+                task_id: job_status or {"status": "error", "message": "Job not found"}
+                for task_id, job_status in statuses.items()
+            }
+        })
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class StandingQueryView(View):
+    async def get(self, request: HttpRequest) -> JsonResponse:
+        standing_queries = StandingQuery.objects.filter(is_active=True).values("id", "query", "threshold")
+        return JsonResponse({"results": [standing_query async for standing_query in standing_queries]})
+
+    async def post(self, request: HttpRequest) -> JsonResponse:
+        try:
+            payload = json.loads(request.body or b"{}")
+        except json.JSONDecodeError:
+            payload = request.POST
+
+        if not isinstance(payload, dict):
+            return JsonResponse({"error": "Expected a JSON object"}, status=status.HTTP_400_BAD_REQUEST)
+
+        query = payload.get("query")
+        if not query or not isinstance(query, str):
+            return JsonResponse({"error": "Query is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        threshold = payload.get("threshold")
+        if threshold is not None:
+            invalid_threshold = JsonResponse(
+                {"error": "threshold must be a number between -1 and 1"}, status=status.HTTP_400_BAD_REQUEST
+            )
+            # bool is an int subclass; `true` is not a threshold
+            if isinstance(threshold, bool):
+                return invalid_threshold
+            try:
+                threshold = float(threshold)
+            except (TypeError, ValueError):
+                return invalid_threshold
+            if not -1 <= threshold <= 1:
+                return invalid_threshold
+
+        try:
+            # Thread-sensitive so the ORM writes reuse the connection Django closes at the end of the request
+            standing_query = await sync_to_async(register_standing_query)(query, threshold)
+        except GoogleGenerativeAIError:
+            logger.exception("Failed to embed standing query.")
+            return JsonResponse(
+                {"error": "Embedding service unavailable, try again later"}, status=status.HTTP_502_BAD_GATEWAY
+            )
+        except ValueError:
+            # Raised by the embeddings client when it is not configured (e.g. missing API key)
+            logger.exception("Embeddings client is not configured.")
+            return JsonResponse(
+                {"error": "Embedding service unavailable"}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        return JsonResponse(
+            {"id": standing_query.pk, "query": standing_query.query, "threshold": standing_query.threshold},
+            status=status.HTTP_201_CREATED,
+        )
@@ -1,8 +1,18 @@
 from django.contrib import admin
 
-from .models import NewsArticle
+from .models import NewsArticle, StandingQuery
 
 
 @admin.register(NewsArticle)
 class NewsArticleAdmin(admin.ModelAdmin):
     list_display = ('title', 'published_at', 'url')
+
+
+@admin.register(StandingQuery)
+class StandingQueryAdmin(admin.ModelAdmin):
+    list_display = ('query', 'threshold', 'is_active', 'created_at')
+    exclude = ('embedding',)
+
+    def has_add_permission(self, request):
+        # Standing queries are registered through the API, which embeds them
+        return False
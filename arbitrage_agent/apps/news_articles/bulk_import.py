@@ -0,0 +1,249 @@
+import csv
+import gzip
+import io
+import json
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from datetime import UTC
+from pathlib import Path
+
+from dateutil import parser
+from django.db import connection, transaction
+
+from arbitrage_agent.apps.news_articles.models import NewsArticle
+from arbitrage_agent.core.constants import EMBEDDING_SIZE
+
+logger = logging.getLogger(__name__)
+
+STAGING_TABLE = "news_article_import_staging"
+COLUMNS = ("title", "summary", "url", "published_at", "embedding")
+
+
+def iter_jsonl(path: Path) -> Iterator:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping malformed line {line_number} in {path}: {e}")
+
+
+def iter_parquet(path: Path, batch_size: int = 10_000) -> Iterator[dict]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Reading Parquet files requires pyarrow (pip install pyarrow).") from e
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+        yield from batch.to_pylist()
+
+
+def iter_records(path: Path) -> Iterator[dict]:
+    if path.suffix == ".parquet":
+        return iter_parquet(path)
+    return iter_jsonl(path)
+
+
+def chunked(records: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def normalize_record(record) -> dict | None:
+    """Validate one input record; returns None for rows that cannot be imported."""
+    if not isinstance(record, dict):
+        return None
+    title, url, published_at = record.get("title"), record.get("url"), record.get("published_at")
+    summary = record.get("summary") or ""
+    if not isinstance(title, str) or not isinstance(url, str) or not isinstance(summary, str):
+        return None
+    if not title or not url or not published_at or len(url) > NewsArticle._meta.get_field("url").max_length:
+        return None
+
+    try:
+        if isinstance(published_at, str):
+            published_at = parser.parse(published_at)
+        if published_at.tzinfo is None:
+            published_at = published_at.replace(tzinfo=UTC)
+    except (ValueError, TypeError, OverflowError, AttributeError):
+        return None
+
+    embedding = record.get("embedding")
+    if isinstance(embedding, str):
+        # Already a pgvector literal such as "[0.1,0.2,...]"
+        if not embedding.startswith("[") or not embedding.endswith("]") or embedding.count(",") + 1 != EMBEDDING_SIZE:
+            return None
+    elif embedding is not None:
+        if not isinstance(embedding, list | tuple) or len(embedding) != EMBEDDING_SIZE:
+            return None
+        if not all(isinstance(value, int | float) and not isinstance(value, bool) for value in embedding):
+            return None
+
+    return {
+        "title": title[:255],
+        "summary": summary,
+        "url": url,
+        "published_at": published_at,
+        "embedding": embedding,
+    }
+
+
+def embed_missing(rows: list[dict], embeddings_model) -> int:
+    """
+    Embed the rows that came without a vector. Returns how many rows are left without one: a failed API call
+    leaves the chunk's embeddings NULL instead of aborting a long import.
+    """
+    missing = [row for row in rows if row["embedding"] is None]
+    if not missing or embeddings_model is None:
+        return len(missing)
+
+    # Same input and truncation as the RSS ingestion path
+    texts = [f"{row['title']} {row['summary']}"[:25000] for row in missing]
+    try:
+        vectors = embeddings_model.embed_documents(texts)
+    except Exception as e:
+        logger.warning(f"Failed to embed {len(missing)} records, importing them without embedding: "
+                       f"{type(e).__name__} - {e}")
+        return len(missing)
+
+    if len(vectors) != len(missing):
+        logger.warning(f"Got {len(vectors)} embeddings for {len(missing)} records, importing them without embedding")
+        return len(missing)
+    for row, vector in zip(missing, vectors, strict=True):
+        row["embedding"] = vector
+    return 0
+
+
+def format_vector(embedding: str | Iterable[float]) -> str:
+    """pgvector's text representation."""
+    if isinstance(embedding, str):
+        return embedding
+    return "[" + ",".join(map(repr, map(float, embedding))) + "]"
+
+
+def to_csv(rows: list[dict]) -> io.StringIO:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        embedding = row["embedding"]
+        writer.writerow((
+            row["title"],
+            row["summary"],
+            row["url"],
+            row["published_at"].isoformat(),
+            # An empty field is NULL for columns not listed in FORCE_NOT_NULL
+            format_vector(embedding) if embedding is not None else None,
+        ))
+    buffer.seek(0)
+    return buffer
+
+
+def get_vector_indexes(cursor, table: str) -> list[tuple[str, str]]:
+    cursor.execute(
+        "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s "
+        "AND (indexdef ILIKE '%%USING hnsw%%' OR indexdef ILIKE '%%USING ivfflat%%')",
+        [table],
+    )
+    return cursor.fetchall()
+
+
+class BulkImportStats:
+    def __init__(self):
+        self.read = self.skipped = self.staged = self.inserted = self.unembedded = 0
+        self.prepare_seconds = self.copy_seconds = self.insert_seconds = self.index_seconds = 0.0
+        self.started_at = time.perf_counter()
+
+    @property
+    def total_seconds(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def as_dict(self) -> dict:
+        total = self.total_seconds
+        return {
+            "read": self.read,
+            "skipped": self.skipped,
+            "staged": self.staged,
+            "unembedded": self.unembedded,
+            "inserted": self.inserted,
+            "prepare_seconds": round(self.prepare_seconds, 2),
+            "copy_seconds": round(self.copy_seconds, 2),
+            "copy_rows_per_sec": round(self.staged / self.copy_seconds) if self.copy_seconds else None,
+            "insert_seconds": round(self.insert_seconds, 2),
+            "index_seconds": round(self.index_seconds, 2),
+            "total_seconds": round(total, 2),
+            "rows_per_sec": round(self.inserted / total) if total else None,
+        }
+
+
+def bulk_import(
+    records: Iterable[dict],
+    embeddings_model=None,
+    chunk_size: int = 10_000,
+    defer_vector_indexes: bool = True,
+    on_progress=None,
+) -> BulkImportStats:
+    """
+    Stream records into a temporary staging table with COPY, then move them into `NewsArticle` with a single
+    `INSERT ... ON CONFLICT (url) DO NOTHING`. Vector indexes are dropped for the load and rebuilt at the end,
+    which is much faster than maintaining them row by row.
+    """
+    stats = BulkImportStats()
+    table = NewsArticle._meta.db_table
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE {STAGING_TABLE} ("
+            f"title varchar(255), summary text, url varchar(200), published_at timestamptz, "
+            f"embedding vector({EMBEDDING_SIZE})"
+            f") ON COMMIT DROP"
+        )
+
+        for chunk in chunked(records, chunk_size):
+            started = time.perf_counter()
+            stats.read += len(chunk)
+            rows = [row for row in map(normalize_record, chunk) if row is not None]
+            stats.skipped += len(chunk) - len(rows)
+            stats.unembedded += embed_missing(rows, embeddings_model)
+            payload = to_csv(rows)
+            stats.prepare_seconds += time.perf_counter() - started
+
+            started = time.perf_counter()
+            cursor.copy_expert(
+                f"COPY {STAGING_TABLE} ({', '.join(COLUMNS)}) FROM STDIN "
+                f"WITH (FORMAT csv, FORCE_NOT_NULL (title, summary, url))",
+                payload,
+            )
+            stats.copy_seconds += time.perf_counter() - started
+            stats.staged += len(rows)
+            if on_progress:
+                on_progress(stats)
+
+        vector_indexes = get_vector_indexes(cursor, table) if defer_vector_indexes else []
+        for index_name, _ in vector_indexes:
+            cursor.execute(f'DROP INDEX "{index_name}"')
+
+        started = time.perf_counter()
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(COLUMNS)}) "
+            f"SELECT {', '.join(COLUMNS)} FROM {STAGING_TABLE} "
+            f"ON CONFLICT (url) DO NOTHING"
+        )
+        stats.inserted = cursor.rowcount
+        stats.insert_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _, index_definition in vector_indexes:
+            cursor.execute(index_definition)
+        stats.index_seconds = time.perf_counter() - started
+
+    return stats
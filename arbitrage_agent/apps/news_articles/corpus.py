@@ -0,0 +1,163 @@
+import logging
+import multiprocessing
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from functools import partial
+
+import numpy as np
+from django.db import connection, connections, transaction
+
+from arbitrage_agent.apps.news_articles.bulk_import import bulk_import, get_vector_indexes
+from arbitrage_agent.apps.news_articles.models import NewsArticle
+from arbitrage_agent.core.constants import EMBEDDING_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Rows are generated in fixed blocks, each with its own random streams, so row N is identical
+# regardless of how the corpus is split across shards, processes or incremental runs.
+BLOCK_SIZE = 10_000
+CORPUS_START = datetime(2021, 1, 1, tzinfo=UTC)
+# One article every 30 seconds: 5M rows cover a little under five years
+ARTICLE_INTERVAL = timedelta(seconds=30)
+URL_PREFIX = "https://synthetic.arbitrage-agent.local/news/"
+
+ASSETS = ["Bitcoin", "Ethereum", "Solana", "XRP", "Cardano", "Avalanche", "Chainlink", "Polygon"]
+TOPICS = [
+    ("ETF flows", "etf inflows outflows issuer custody institutional demand spot filing approval"),
+    ("exchange listing", "exchange listing liquidity volume pair trading launch market makers order book"),
+    ("network upgrade", "upgrade mainnet fork validators fees throughput developers testnet release"),
+    ("regulation", "regulator sec lawsuit compliance framework bill enforcement court ruling policy"),
+    ("stablecoin supply", "stablecoin mint redemption reserves treasury peg issuance attestation supply"),
+    ("DeFi exploit", "exploit hack protocol bridge vulnerability drained audit attacker funds recovered"),
+    ("macro outlook", "fed rates inflation dollar yields risk assets liquidity macro recession jobs"),
+    ("funding and basis", "funding rates basis futures perpetuals open interest leverage liquidations premium"),
+]
+SENTENCE_LENGTH = 12
+
+
+def make_centroids(seed: int, clusters: int, dimensions: int = EMBEDDING_SIZE) -> np.ndarray:
+    centroids = np.random.default_rng([seed]).standard_normal((clusters, dimensions), dtype=np.float32)
+    return centroids / np.linalg.norm(centroids, axis=1, keepdims=True)
+
+
+def cluster_weights(clusters: int) -> np.ndarray:
+    # Zipf-like skew: a few dominant stories, a long tail of niche ones
+    weights = 1 / np.arange(1, clusters + 1) ** 0.8
+    return weights / weights.sum()
+
+
+def cluster_label(cluster: int) -> tuple[str, str, list[str]]:
+    topic, words = TOPICS[cluster % len(TOPICS)]
+    return ASSETS[(cluster // len(TOPICS)) % len(ASSETS)], topic, words.split()
+
+
+def generate_block(
+    seed: int, block: int, count: int, centroids: np.ndarray, noise: float
+) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    """
+    The first `count` rows of a block: cluster assignments, unit-norm embeddings scattered around their
+    cluster centroid, and summaries drawn from the cluster's vocabulary.
+    """
+    clusters, dimensions = centroids.shape
+    assignments = np.random.default_rng([seed, block, 0]).choice(clusters, size=count, p=cluster_weights(clusters))
+    offsets = np.random.default_rng([seed, block, 1]).standard_normal((count, dimensions), dtype=np.float32)
+    # `noise` is the expected norm of the offset, i.e. how loose each cluster is
+    vectors = centroids[assignments] + offsets * (noise / np.sqrt(dimensions))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    word_picks = np.random.default_rng([seed, block, 2]).integers(0, 1 << 16, size=(count, 2 * SENTENCE_LENGTH))
+    summaries = []
+    for cluster, picks in zip(assignments, word_picks, strict=True):
+        asset, _, words = cluster_label(int(cluster))
+        first = " ".join(words[i % len(words)] for i in picks[:SENTENCE_LENGTH])
+        second = " ".join(words[i % len(words)] for i in picks[SENTENCE_LENGTH:])
+        summaries.append(f"{asset} {first}. Analysts watch {second}.")
+    return assignments, vectors, summaries
+
+
+def iter_synthetic_articles(
+    start: int, stop: int, seed: int, centroids: np.ndarray, noise: float
+) -> Iterator[dict]:
+    """Records for rows [start, stop) in the format accepted by `bulk_import`."""
+    vector_format = "[" + ",".join(["%.6g"] * centroids.shape[1]) + "]"
+    for block in range(start // BLOCK_SIZE, (stop - 1) // BLOCK_SIZE + 1):
+        block_start = block * BLOCK_SIZE
+        first, last = max(start, block_start), min(stop, block_start + BLOCK_SIZE)
+        assignments, vectors, summaries = generate_block(seed, block, last - block_start, centroids, noise)
+
+        for offset in range(first - block_start, last - block_start):
+            row = block_start + offset
+            asset, topic, _ = cluster_label(int(assignments[offset]))
+            yield {
+                "title": f"{asset} {topic}: market update #{row}",
+                "summary": summaries[offset],
+                "url": f"{URL_PREFIX}{seed}/{row}",
+                "published_at": CORPUS_START + row * ARTICLE_INTERVAL,
+                # Formatting the whole row in one call is much faster than joining floats one by one
+                "embedding": vector_format % tuple(vectors[offset].tolist()),
+            }
+
+
+def _load_shard(bounds: tuple[int, int], seed: int, clusters: int, noise: float, chunk_size: int) -> int:
+    start, stop = bounds
+    try:
+        records = iter_synthetic_articles(start, stop, seed, make_centroids(seed, clusters), noise)
+        return bulk_import(records, chunk_size=chunk_size, defer_vector_indexes=False).inserted
+    finally:
+        connections.close_all()
+
+
+def generate_corpus(
+    rows: int,
+    start: int = 0,
+    seed: int = 42,
+    clusters: int = 64,
+    noise: float = 0.6,
+    processes: int = 1,
+    shard_size: int = 100_000,
+    chunk_size: int = 10_000,
+) -> dict:
+    """
+    Insert synthetic articles for rows [start, start + rows), loading shards in parallel processes.
+    Vector indexes are dropped once for the whole load and rebuilt at the end.
+    """
+    started = time.perf_counter()
+    table = NewsArticle._meta.db_table
+    with connection.cursor() as cursor:
+        vector_indexes = get_vector_indexes(cursor, table)
+        for index_name, _ in vector_indexes:
+            cursor.execute(f'DROP INDEX "{index_name}"')
+
+    stop = start + rows
+    shards = [(shard_start, min(shard_start + shard_size, stop)) for shard_start in range(start, stop, shard_size)]
+    load = partial(_load_shard, seed=seed, clusters=clusters, noise=noise, chunk_size=chunk_size)
+
+    inserted = 0
+    try:
+        if processes <= 1:
+            for shard in shards:
+                inserted += load(shard)
+        else:
+            # Children must not inherit the parent's database socket
+            connections.close_all()
+            with multiprocessing.get_context("fork").Pool(processes) as pool:
+                for shard_inserted in pool.imap_unordered(load, shards):
+                    inserted += shard_inserted
+                    logger.info(f"Loaded {inserted} of {rows} synthetic articles")
+        load_seconds = time.perf_counter() - started
+    finally:
+        # Restore the dropped indexes even if a shard failed; committed shards stay in place
+        started = time.perf_counter()
+        with transaction.atomic(), connection.cursor() as cursor:
+            for _, index_definition in vector_indexes:
+                cursor.execute(index_definition)
+            cursor.execute(f"ANALYZE {table}")
+
+    return {
+        "rows": rows,
+        "inserted": inserted,
+        "load_seconds": round(load_seconds, 2),
+        "rows_per_sec": round(inserted / load_seconds) if load_seconds else None,
+        "index_seconds": round(time.perf_counter() - started, 2),
+    }
@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DatabaseError
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+from arbitrage_agent.apps.news_articles.bulk_import import BulkImportStats, bulk_import, iter_records
+from arbitrage_agent.core.constants import EMBEDDING_MODEL, EMBEDDING_SIZE
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk imports news articles from JSONL (optionally gzipped) or Parquet files through COPY. "
+        "Records need title, url and published_at, plus an optional summary and precomputed embedding."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('paths', nargs='+', type=Path, help='JSONL, JSONL.gz or Parquet files to import')
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=10_000,
+            help='Records embedded and copied per round trip'
+        )
+        parser.add_argument(
+            '--no-embed',
+            action='store_true',
+            help='Store records without a precomputed embedding as-is instead of embedding them'
+        )
+        parser.add_argument(
+            '--keep-indexes',
+            action='store_true',
+            help='Maintain vector indexes during the load instead of rebuilding them at the end'
+        )
+        parser.add_argument('--json', action='store_true', help='Print the final statistics as JSON')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for path in options['paths']:
+            if not path.is_file():
+                raise CommandError(f"File not found: {path}")
+
+        embeddings_model = None
+        if not options['no_embed']:
+            if not settings.GEMINI_API_KEY:
+                raise CommandError("GEMINI_API_KEY is not set. Use --no-embed to import without embedding.")
+            embeddings_model = GoogleGenerativeAIEmbeddings(
+                model=EMBEDDING_MODEL,
+                google_api_key=settings.GEMINI_API_KEY,
+                output_dimensionality=EMBEDDING_SIZE,
+            )
+
+        records = (record for path in options['paths'] for record in iter_records(path))
+        try:
+            stats = bulk_import(
+                records,
+                embeddings_model=embeddings_model,
+                chunk_size=options['chunk_size'],
+                defer_vector_indexes=not options['keep_indexes'],
+                on_progress=self.report_progress,
+            )
+        except (DatabaseError, ImportError, OSError, UnicodeDecodeError) as e:
+            raise CommandError(f"Bulk import failed, nothing was imported: {e}") from e
+
+        summary = stats.as_dict()
+        if options['json']:
+            self.stdout.write(json.dumps(summary))
+            return
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {summary['inserted']} new articles out of {summary['read']} records "
+            f"({summary['skipped']} invalid, {summary['staged'] - summary['inserted']} already present) "
+            f"in {summary['total_seconds']}s: {summary['rows_per_sec']} rows/sec overall, "
+            f"{summary['copy_rows_per_sec']} rows/sec through COPY."
+        ))
+        if embeddings_model is not None and summary['unembedded']:
+            self.stdout.write(self.style.WARNING(
+                f"{summary['unembedded']} records were stored without an embedding because the embedding API failed."
+            ))
+
+    def report_progress(self, stats: BulkImportStats) -> None:
+        elapsed = stats.total_seconds
+        rate = round(stats.staged / elapsed) if elapsed else 0
+        self.stderr.write(f"Staged {stats.staged} of {stats.read} records ({rate} rows/sec)")
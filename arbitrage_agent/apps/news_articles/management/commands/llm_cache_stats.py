@@ -0,0 +1,33 @@
+import json
+from typing import Any
+
+import django_rq
+from django.core.management.base import BaseCommand, CommandParser
+
+from arbitrage_agent.core.constants import HIGH_PRIORITY_QUEUE
+from arbitrage_agent.core.llm_cache import clear_cache, get_cache_stats
+
+
+class Command(BaseCommand):
+    help = 'Shows hit-rate metrics of the agent LLM call cache'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--clear', action='store_true', help='Drop all cached responses and reset the metrics')
+        parser.add_argument('--json', action='store_true', help='Print the metrics as JSON')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        connection = django_rq.get_connection(HIGH_PRIORITY_QUEUE)
+        stats = get_cache_stats(connection)
+
+        if options['json']:
+            self.stdout.write(json.dumps(stats))
+        else:
+            hit_rate = "n/a" if stats['hit_rate'] is None else f"{stats['hit_rate']:.1%}"
+            self.stdout.write(
+                f"Hits: {stats['hits']}  Misses: {stats['misses']}  Hit rate: {hit_rate}  "
+                f"Tokens saved: {stats['tokens_saved']}  Entries: {stats['entries']}"
+            )
+
+        if options['clear']:
+            clear_cache(connection)
+            self.stdout.write(self.style.SUCCESS("LLM cache cleared."))
@@ -0,0 +1,84 @@
+from typing import Any
+
+import django_rq
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from rq.serializers import resolve_serializer
+
+from arbitrage_agent.core.constants import WORKER_QUEUES
+from arbitrage_agent.core.workers import PreforkWorkerPool, QueueDepthScaler
+
+
+class Command(BaseCommand):
+    help = 'Warms up the agent once, then forks an autoscaling pool of RQ workers'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            'queues',
+            nargs='*',
+            default=WORKER_QUEUES,
+            help='Queues to listen on, highest priority first'
+        )
+        parser.add_argument(
+            '--min-workers',
+            type=int,
+            default=settings.RQ_POOL_MIN_WORKERS,
+            help='Lower bound on the number of worker processes'
+        )
+        parser.add_argument(
+            '--max-workers',
+            type=int,
+            default=settings.RQ_POOL_MAX_WORKERS,
+            help='Upper bound on the number of worker processes'
+        )
+        parser.add_argument(
+            '--jobs-per-worker',
+            type=int,
+            default=settings.RQ_POOL_JOBS_PER_WORKER,
+            help='Queued jobs that justify one additional worker'
+        )
+        parser.add_argument(
+            '--scale-interval',
+            type=float,
+            default=settings.RQ_POOL_SCALE_INTERVAL,
+            help='Seconds between autoscaling decisions'
+        )
+        parser.add_argument(
+            '--burst',
+            action='store_true',
+            help='Exit once the queues are empty'
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        queue_names = options['queues']
+        connection = django_rq.get_connection(queue_names[0])
+
+        try:
+            scaler = QueueDepthScaler(
+                connection,
+                queue_names,
+                min_workers=options['min_workers'],
+                max_workers=options['max_workers'],
+                jobs_per_worker=options['jobs_per_worker'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write("Warming up agent graph and model clients...")
+        sampler = PreforkWorkerPool.warm_up()
+
+        pool = PreforkWorkerPool(
+            queue_names,
+            connection=connection,
+            num_workers=max(options['min_workers'], 1),
+            serializer=resolve_serializer(settings.RQ_SERIALIZER),
+            scaler=scaler,
+            scale_interval=options['scale_interval'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Starting worker pool on queues: {', '.join(queue_names)}"))
+        try:
+            pool.start(burst=options['burst'])
+        finally:
+            if sampler is not None:
+                sampler.stop()
+                sampler.join(timeout=5)
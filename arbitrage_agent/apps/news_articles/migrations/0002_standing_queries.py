@@ -0,0 +1,40 @@
+# Generated by Django 5.2 on 2026-10-19 14:36
+
+import django.db.models.deletion
+import pgvector.django
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_articles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StandingQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query', models.TextField()),
+                ('embedding', pgvector.django.VectorField(dimensions=768)),
+                ('threshold', models.FloatField(default=0.75)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='StandingQueryMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('job_id', models.CharField(blank=True, max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='standing_query_matches', to='news_articles.newsarticle')),
+                ('standing_query', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='news_articles.standingquery')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('standing_query', 'article'), name='unique_standing_query_article')],
+            },
+        ),
+    ]
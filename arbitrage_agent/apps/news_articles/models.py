@@ -14,3 +14,32 @@ class NewsArticle(models.Model):
 
     def __str__(self):
         return self.title
+
+
+class StandingQuery(models.Model):
+    """A watchlist query that is matched against every newly ingested article."""
+    query = models.TextField()
+    embedding = VectorField(dimensions=EMBEDDING_SIZE)
+    # Minimum cosine similarity between the query and an article to trigger an analysis
+    threshold = models.FloatField(default=0.75)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.query
+
+
+class StandingQueryMatch(models.Model):
+    standing_query = models.ForeignKey(StandingQuery, on_delete=models.CASCADE, related_name="matches")
+    article = models.ForeignKey(NewsArticle, on_delete=models.CASCADE, related_name="standing_query_matches")
+    score = models.FloatField()
+    job_id = models.CharField(max_length=64, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["standing_query", "article"], name="unique_standing_query_article"),
+        ]
+
+    def __str__(self):
+        return f"{self.standing_query_id} -> {self.article_id} ({self.score:.2f})"
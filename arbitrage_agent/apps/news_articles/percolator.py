@@ -0,0 +1,106 @@
+import logging
+
+import django_rq
+import numpy as np
+from django.conf import settings
+from django.db import DatabaseError
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+from arbitrage_agent.apps.news_articles.models import NewsArticle, StandingQuery, StandingQueryMatch
+from arbitrage_agent.core.constants import DEFAULT_QUEUE, EMBEDDING_MODEL, EMBEDDING_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def register_standing_query(query: str, threshold: float | None = None) -> StandingQuery:
+    """Embed the query once and store it; it is then matched against every ingest batch."""
+    embeddings = GoogleGenerativeAIEmbeddings(
+        model=EMBEDDING_MODEL,
+        output_dimensionality=EMBEDDING_SIZE,
+        api_key=settings.GEMINI_API_KEY,
+    )
+    return StandingQuery.objects.create(
+        query=query,
+        embedding=embeddings.embed_query(query),
+        threshold=settings.STANDING_QUERY_DEFAULT_THRESHOLD if threshold is None else threshold,
+    )
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def score_articles(
+    article_vectors: np.ndarray, query_vectors: np.ndarray, thresholds: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cosine similarity of every new article against every standing query, in a single matrix product.
+    Returns the (article_index, query_index) pairs that reach the query's threshold, and the score matrix.
+    """
+    scores = _normalize_rows(article_vectors) @ _normalize_rows(query_vectors).T
+    return np.argwhere(scores >= thresholds[np.newaxis, :]), scores
+
+
+def build_analysis_prompt(standing_query: StandingQuery, articles: list[NewsArticle]) -> str:
+    headlines = "\n".join(f"- {article.title} ({article.url})" for article in articles)
+    return (
+        f"Standing query: {standing_query.query}\n"
+        f"These newly published articles match it:\n{headlines}\n"
+        "Assess whether they create an actionable opportunity."
+    )
+
+
+def percolate_articles(articles: list[NewsArticle]) -> int:
+    """
+    Match freshly ingested articles against all active standing queries and enqueue one targeted
+    analysis per query that has matches. Returns the number of jobs enqueued.
+    """
+    # Imported lazily: the agent module builds the LLM graph at import time
+    from arbitrage_agent.core.logic import ask_agent
+
+    articles = [article for article in articles if article.pk and article.embedding is not None]
+    standing_queries = list(StandingQuery.objects.filter(is_active=True))
+    if not articles or not standing_queries:
+        return 0
+
+    article_vectors = np.array([article.embedding for article in articles], dtype=np.float32)
+    query_vectors = np.array([query.embedding for query in standing_queries], dtype=np.float32)
+    thresholds = np.array([query.threshold for query in standing_queries], dtype=np.float32)
+
+    pairs, scores = score_articles(article_vectors, query_vectors, thresholds)
+    matched_by_query: dict[int, list[int]] = {}
+    for article_index, query_index in pairs:
+        matched_by_query.setdefault(int(query_index), []).append(int(article_index))
+
+    queue = django_rq.get_queue(DEFAULT_QUEUE)
+    matches = []
+    for query_index, article_indexes in matched_by_query.items():
+        standing_query = standing_queries[query_index]
+        matched_articles = [articles[index] for index in article_indexes]
+        job = queue.enqueue(
+            ask_agent,
+            build_analysis_prompt(standing_query, matched_articles),
+            meta={"standing_query_id": standing_query.pk},
+            result_ttl=settings.ANALYSIS_RESULT_TTL,
+        )
+        matches.extend(
+            StandingQueryMatch(
+                standing_query=standing_query,
+                article=articles[index],
+                score=float(scores[index, query_index]),
+                job_id=job.id,
+            )
+            for index in article_indexes
+        )
+
+    try:
+        StandingQueryMatch.objects.bulk_create(matches, ignore_conflicts=True)
+    except DatabaseError as e:
+        logger.error(f"Failed to record standing query matches: {e}")
+
+    logger.info(
+        f"Percolated {len(articles)} articles against {len(standing_queries)} standing queries: "
+        f"{len(matched_by_query)} analyses enqueued."
+    )
+    return len(matched_by_query)
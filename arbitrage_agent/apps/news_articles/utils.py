@@ -5,8 +5,10 @@ from dateutil import parser
 from django.conf import settings
 from django.db import DatabaseError, IntegrityError
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
+from redis.exceptions import RedisError
 
 from arbitrage_agent.apps.news_articles.models import NewsArticle
+from arbitrage_agent.apps.news_articles.percolator import percolate_articles
 from arbitrage_agent.core.constants import EMBEDDING_MODEL, EMBEDDING_SIZE
 
 logger = logging.getLogger(__name__)
@@ -95,7 +97,15 @@ def fetch_and_store_news(batch_size: int = 20, commit: bool = True):
             logger.info(f"Successfully ingested {len(new_articles)} news articles!")
         except IntegrityError as e:
             logger.error(f"Database integrity error: {e}")
+            return
         except DatabaseError as e:
             logger.error(f"Database error during bulk create: {e}")
+            return
+
+        # Only the new batch is scored against the standing queries, never the whole corpus
+        try:
+            percolate_articles(new_articles)
+        except (DatabaseError, RedisError) as e:
+            logger.error(f"Failed to percolate new articles: {e}")
     else:
         logger.info(f'Finish without saving {len(new_articles)} articles to database')
@@ -0,0 +1,9 @@
+from django.contrib import admin
+
+from .models import PriceBar
+
+
+@admin.register(PriceBar)
+class PriceBarAdmin(admin.ModelAdmin):
+    list_display = ('asset', 'source', 'resolution', 'bucket_start', 'close', 'tick_count')
+    list_filter = ('asset', 'source', 'resolution')
@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-19 14:38
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PriceBar',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('asset', models.CharField(max_length=16)),
+                ('source', models.CharField(max_length=32)),
+                ('resolution', models.PositiveIntegerField(help_text='Bar width in seconds')),
+                ('bucket_start', models.DateTimeField()),
+                ('open', models.FloatField()),
+                ('high', models.FloatField()),
+                ('low', models.FloatField()),
+                ('close', models.FloatField()),
+                ('tick_count', models.PositiveIntegerField()),
+            ],
+            options={
+                'indexes': [django.contrib.postgres.indexes.BrinIndex(fields=['bucket_start'], name='price_bar_bucket_brin')],
+                'constraints': [models.UniqueConstraint(fields=('asset', 'source', 'resolution', 'bucket_start'), name='unique_price_bar')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.contrib.postgres.indexes import BrinIndex
+from django.db import models
+
+
+class PriceBar(models.Model):
+    """OHLC bar downsampled from the in-memory tick buffers (see `arbitrage_agent.core.prices`)."""
+    asset = models.CharField(max_length=16)
+    # Exchange name, or the cross-exchange aggregate
+    source = models.CharField(max_length=32)
+    resolution = models.PositiveIntegerField(help_text="Bar width in seconds")
+    bucket_start = models.DateTimeField()
+    open = models.FloatField()
+    high = models.FloatField()
+    low = models.FloatField()
+    close = models.FloatField()
+    tick_count = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["asset", "source", "resolution", "bucket_start"], name="unique_price_bar"
+            ),
+        ]
+        indexes = [
+            # Bars are appended in time order, so a BRIN index stays tiny while still pruning range scans
+            BrinIndex(fields=["bucket_start"], name="price_bar_bucket_brin"),
+        ]
+
+    def __str__(self):
+        return f"{self.asset}@{self.source} {self.resolution}s {self.bucket_start:%Y-%m-%d %H:%M}"
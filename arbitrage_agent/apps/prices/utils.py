@@ -0,0 +1,54 @@
+import logging
+from datetime import UTC, datetime
+
+import numpy as np
+from django.db import DatabaseError, connections
+
+from arbitrage_agent.apps.prices.models import PriceBar
+from arbitrage_agent.core.prices import AGGREGATE_SOURCE, PriceHistory, build_bars
+
+logger = logging.getLogger(__name__)
+
+
+def store_bars(history: PriceHistory, resolutions: list[int], since: float) -> None:
+    """Upsert the OHLC bars touched since `since` for every buffered asset/source."""
+    bars = []
+    for (asset, source), buffer in history.buffers.items():
+        times, prices = buffer.snapshot()
+        # Once the buffer is full the oldest bucket may be missing ticks that were overwritten
+        complete_from = times[0] if len(buffer) == buffer.capacity else 0
+        for resolution in resolutions:
+            for bar in build_bars(times, prices, resolution, since=since, complete_from=complete_from):
+                bucket_start = datetime.fromtimestamp(bar.pop("bucket_start"), tz=UTC)
+                bars.append(PriceBar(asset=asset, source=source, resolution=resolution,
+                                     bucket_start=bucket_start, **bar))
+
+    if not bars:
+        return
+
+    try:
+        PriceBar.objects.bulk_create(
+            bars,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=['asset', 'source', 'resolution', 'bucket_start'],
+            update_fields=['open', 'high', 'low', 'close', 'tick_count'],
+        )
+        logger.info(f"Flushed {len(bars)} price bars.")
+    except DatabaseError as e:
+        logger.error(f"Database error while flushing price bars: {e}")
+    finally:
+        # The sampler process is long-lived and flushes rarely; don't keep an idle connection open in between
+        connections.close_all()
+
+
+def load_bar_closes(asset: str, since: datetime, resolution: int = 60) -> tuple[np.ndarray, np.ndarray]:
+    """Close prices of the aggregate bars since `since`, for processes without a live tick buffer."""
+    rows = list(
+        PriceBar.objects.filter(
+            asset=asset.upper(), source=AGGREGATE_SOURCE, resolution=resolution, bucket_start__gte=since
+        ).order_by('bucket_start').values_list('bucket_start', 'close')
+    )
+    times = np.array([bucket_start.timestamp() for bucket_start, _ in rows], dtype=np.float64)
+    prices = np.array([close for _, close in rows], dtype=np.float64)
+    return times, prices
@@ -0,0 +1,8 @@
+from django.contrib import admin
+
+from .models import Transcript
+
+
+@admin.register(Transcript)
+class TranscriptAdmin(admin.ModelAdmin):
+    list_display = ('job_id', 'query', 'message_count', 'created_at')
@@ -0,0 +1,52 @@
+# Generated by Django 5.2 on 2026-10-19 14:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ToolOutput',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('content', models.TextField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Transcript',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_id', models.CharField(max_length=64, unique=True)),
+                ('query', models.TextField()),
+                ('answer', models.TextField(blank=True)),
+                ('message_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TranscriptMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField()),
+                ('role', models.CharField(max_length=16)),
+                ('content', models.TextField(blank=True)),
+                ('name', models.CharField(blank=True, max_length=64)),
+                ('tool_calls', models.JSONField(blank=True, null=True)),
+                ('tool_call_id', models.CharField(blank=True, max_length=128)),
+                ('tool_output', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='transcripts.tooloutput')),
+                ('transcript', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='messages', to='transcripts.transcript')),
+            ],
+            options={
+                'ordering': ['position'],
+                'constraints': [models.UniqueConstraint(fields=('transcript', 'position'), name='unique_transcript_position')],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import models
+
+
+class Transcript(models.Model):
+    job_id = models.CharField(max_length=64, unique=True)
+    query = models.TextField()
+    answer = models.TextField(blank=True)
+    message_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.job_id}: {self.query[:50]}"
+
+
+class ToolOutput(models.Model):
+    # Identical tool results (e.g. the same news retrieved by many runs) are stored once, keyed by content hash
+    content_hash = models.CharField(max_length=64, unique=True)
+    content = models.TextField()
+
+    def __str__(self):
+        return self.content_hash
+
+
+class TranscriptMessage(models.Model):
+    transcript = models.ForeignKey(Transcript, on_delete=models.CASCADE, related_name="messages")
+    position = models.PositiveIntegerField()
+    role = models.CharField(max_length=16)
+    content = models.TextField(blank=True)
+    name = models.CharField(max_length=64, blank=True)
+    tool_calls = models.JSONField(null=True, blank=True)
+    tool_call_id = models.CharField(max_length=128, blank=True)
+    tool_output = models.ForeignKey(ToolOutput, on_delete=models.PROTECT, null=True, blank=True)
+
+    class Meta:
+        ordering = ["position"]
+        constraints = [
+            models.UniqueConstraint(fields=["transcript", "position"], name="unique_transcript_position"),
+        ]
+
+    def __str__(self):
+        return f"{self.transcript_id}#{self.position} ({self.role})"
@@ -0,0 +1,92 @@
+import hashlib
+import json
+import logging
+
+from django.db import DatabaseError, transaction
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+from arbitrage_agent.apps.transcripts.models import ToolOutput, Transcript, TranscriptMessage
+
+logger = logging.getLogger(__name__)
+
+
+def _content_to_text(content: str | list) -> str:
+    # Gemini may return content as a list of parts rather than a plain string
+    return content if isinstance(content, str) else json.dumps(content)
+
+
+def save_transcript(job_id: str, query: str, messages: list[BaseMessage]) -> Transcript | None:
+    """Persist the full message history of an agent run, storing each distinct tool output only once."""
+    tool_outputs = {}
+    for message in messages:
+        if isinstance(message, ToolMessage):
+            text = _content_to_text(message.content)
+            tool_outputs[hashlib.sha256(text.encode()).hexdigest()] = text
+
+    try:
+        with transaction.atomic():
+            ToolOutput.objects.bulk_create(
+                [ToolOutput(content_hash=digest, content=text) for digest, text in tool_outputs.items()],
+                ignore_conflicts=True,
+            )
+            output_ids = dict(
+                ToolOutput.objects.filter(content_hash__in=list(tool_outputs)).values_list('content_hash', 'id')
+            )
+
+            transcript = Transcript.objects.create(
+                job_id=job_id,
+                query=query,
+                answer=_content_to_text(messages[-1].content) if messages else "",
+                message_count=len(messages),
+            )
+
+            rows = []
+            for position, message in enumerate(messages):
+                row = TranscriptMessage(transcript=transcript, position=position, role=message.type)
+                if isinstance(message, ToolMessage):
+                    digest = hashlib.sha256(_content_to_text(message.content).encode()).hexdigest()
+                    row.tool_output_id = output_ids[digest]
+                    row.tool_call_id = message.tool_call_id
+                    row.name = message.name or ""
+                else:
+                    row.content = _content_to_text(message.content)
+                if isinstance(message, AIMessage) and message.tool_calls:
+                    row.tool_calls = message.tool_calls
+                rows.append(row)
+
+            TranscriptMessage.objects.bulk_create(rows, batch_size=100)
+    except DatabaseError as e:
+        # Losing the audit trail must not fail the analysis itself
+        logger.error(f"Failed to save transcript for job {job_id}: {e}")
+        return None
+
+    return transcript
+
+
+def serialize_message(message: TranscriptMessage) -> dict:
+    return {
+        "position": message.position,
+        "role": message.role,
+        "content": message.tool_output.content if message.tool_output_id else message.content,
+        "name": message.name,
+        "tool_calls": message.tool_calls,
+        "tool_call_id": message.tool_call_id,
+    }
+
+
+async def aget_transcript_page(job_id: str, page: int, page_size: int) -> dict | None:
+    """Load a single page of a transcript; only the requested messages are read from the database."""
+    transcript = await Transcript.objects.filter(job_id=job_id).afirst()
+    if transcript is None:
+        return None
+
+    offset = (page - 1) * page_size
+    messages = TranscriptMessage.objects.filter(transcript=transcript).select_related('tool_output')
+    return {
+        "task_id": job_id,
+        "query": transcript.query,
+        "page": page,
+        "page_size": page_size,
+        "total": transcript.message_count,
+        "messages": [serialize_message(message) async for message in messages[offset:offset + page_size]],
+    }
@@ -9,8 +9,15 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
+from django.contrib.staticfiles.handlers import ASGIStaticFilesHandler
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "arbitrage_agent.settings")
 
 application = get_asgi_application()
+
+# uvicorn does not serve static files the way runserver does; in development let Django serve the
+# admin and django-rq dashboard assets. In production run collectstatic and serve STATIC_ROOT separately.
+if settings.DEBUG:
+    application = ASGIStaticFilesHandler(application)
@@ -0,0 +1,35 @@
+import asyncio
+
+from django.conf import settings
+from redis import asyncio as aioredis
+
+from .constants import HIGH_PRIORITY_QUEUE
+
+# Async connections are bound to the event loop that opened them, so keep one pool per loop.
+# Under uvicorn that is a single pool per process; under runserver each async view runs in its own short-lived
+# loop, so every pool is paired with a task that disconnects it when that loop shuts down.
+_async_pools: dict[asyncio.AbstractEventLoop, tuple[aioredis.BlockingConnectionPool, asyncio.Task]] = {}
+
+
+async def _disconnect_on_shutdown(loop: asyncio.AbstractEventLoop, pool: aioredis.BlockingConnectionPool) -> None:
+    """Wait until the loop shuts down (asyncio.run cancels the tasks still pending), then close the pool."""
+    try:
+        await loop.create_future()
+    finally:
+        _async_pools.pop(loop, None)
+        await pool.disconnect()
+
+
+def get_async_redis() -> aioredis.Redis:
+    """Async Redis client for the RQ database, backed by a shared connection pool."""
+    loop = asyncio.get_running_loop()
+    if loop not in _async_pools:
+        # Blocking pool: a burst of pollers waits for a free connection instead of erroring out
+        pool = aioredis.BlockingConnectionPool.from_url(
+            settings.RQ_QUEUES[HIGH_PRIORITY_QUEUE]["URL"],
+            max_connections=settings.ASYNC_REDIS_MAX_CONNECTIONS,
+            timeout=5,
+        )
+        # Keep a reference to the task: the loop itself only holds pending tasks weakly
+        _async_pools[loop] = (pool, loop.create_task(_disconnect_on_shutdown(loop, pool)))
+    return aioredis.Redis(connection_pool=_async_pools[loop][0])
@@ -1,2 +1,8 @@
 EMBEDDING_SIZE = 768
 EMBEDDING_MODEL = "models/gemini-embedding-001"
+
+# RQ queues, in the order workers should drain them
+HIGH_PRIORITY_QUEUE = "high"  # Interactive agent requests
+DEFAULT_QUEUE = "default"
+LOW_PRIORITY_QUEUE = "low"  # Background ingestion
+WORKER_QUEUES = [HIGH_PRIORITY_QUEUE, DEFAULT_QUEUE, LOW_PRIORITY_QUEUE]
@@ -0,0 +1,203 @@
+import hashlib
+import json
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+# Rough chars-per-token ratio for English text; good enough for budgeting without a tokenizer round trip
+CHARS_PER_TOKEN = 4
+ALREADY_RETRIEVED = "already retrieved above"
+
+
+def _text(message: BaseMessage) -> str:
+    return message.content if isinstance(message.content, str) else json.dumps(message.content)
+
+
+def estimate_tokens(messages: list[BaseMessage]) -> int:
+    total = 0
+    for message in messages:
+        total += len(_text(message))
+        if isinstance(message, AIMessage) and message.tool_calls:
+            total += len(json.dumps(message.tool_calls))
+    return total // CHARS_PER_TOKEN
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}... [truncated {len(text) - max_chars} chars]"
+
+
+def _compact_search_results(content: str, url_owners: dict[str, int], index: int, summary_chars: int) -> str:
+    """
+    Shrink a `search_internal_news` JSON payload: drop articles already shown, shorten summaries.
+    `url_owners` maps each URL to the index of the message holding its full copy.
+    """
+    try:
+        articles = json.loads(content)
+    except json.JSONDecodeError:
+        return content
+    if not isinstance(articles, list):
+        return content
+
+    compacted = []
+    for article in articles:
+        if not isinstance(article, dict):
+            return content
+        url = article.get("url")
+        if url in url_owners:
+            compacted.append({"url": url, "note": ALREADY_RETRIEVED})
+            continue
+        url_owners[url] = index
+        compacted.append({**article, "summary": _truncate(article.get("summary", ""), summary_chars)})
+    return json.dumps(compacted)
+
+
+def _drop_references(content: str, urls: set[str]) -> str:
+    """Mark references to articles whose full copy was removed from the prompt as omitted."""
+    try:
+        articles = json.loads(content)
+    except json.JSONDecodeError:
+        return content
+    if not isinstance(articles, list) or not all(isinstance(article, dict) for article in articles):
+        return content
+
+    for article in articles:
+        if article.get("note") == ALREADY_RETRIEVED and article.get("url") in urls:
+            article["note"] = "omitted to fit the context budget"
+    return json.dumps(articles)
+
+
+def _replace_content(message: ToolMessage, content: str) -> ToolMessage:
+    return message.model_copy(update={"content": content})
+
+
+def _is_text_block(part: str | dict) -> bool:
+    return isinstance(part, dict) and part.get("type") == "text" and isinstance(part.get("text"), str)
+
+
+def _text_parts(content: str | list) -> list[str]:
+    if isinstance(content, str):
+        return [content]
+    return [part if isinstance(part, str) else part["text"] for part in content
+            if isinstance(part, str) or _is_text_block(part)]
+
+
+def _truncate_text_parts(content: str | list, max_chars: int) -> str | list:
+    """
+    Keep the first `max_chars` characters of text in the content. Gemini returns list content whose non-text
+    parts (e.g. thought signatures) must be passed back unchanged, so only strings and text blocks are cut.
+    """
+    if isinstance(content, str):
+        return _truncate(content, max_chars)
+
+    parts = []
+    for part in content:
+        if isinstance(part, str):
+            parts.append(_truncate(part, max_chars))
+            max_chars = max(max_chars - len(part), 0)
+        elif _is_text_block(part):
+            parts.append({**part, "text": _truncate(part["text"], max_chars)})
+            max_chars = max(max_chars - len(part["text"]), 0)
+        else:
+            parts.append(part)
+    return parts
+
+
+def _truncate_to_budget(compacted: list[BaseMessage], indexes: list[int], token_budget: int) -> set[int]:
+    """Truncate the given messages in order until the prompt fits; returns the indexes that were cut."""
+    truncated = set()
+    for index in indexes:
+        excess = estimate_tokens(compacted) - token_budget
+        if excess <= 0:
+            break
+        content = compacted[index].content
+        text_chars = sum(len(text) for text in _text_parts(content))
+        # Leave room for the truncation marker appended by `_truncate`
+        cut = _truncate_text_parts(content, max(text_chars - (excess + 10) * CHARS_PER_TOKEN, 0))
+        if cut != content:
+            compacted[index] = compacted[index].model_copy(update={"content": cut})
+            truncated.add(index)
+    return truncated
+
+
+def compact_messages(
+    messages: list[BaseMessage],
+    token_budget: int,
+    keep_recent: int = 2,
+    summary_chars: int = 200,
+) -> list[BaseMessage]:
+    """
+    Build the prompt sent to the LLM from the full message history.
+
+    Repeated identical tool results only keep their newest copy. Apart from the `keep_recent` most recent ones,
+    tool results are shortened: already-seen articles are dropped from searches and long text is truncated.
+    If the prompt still exceeds `token_budget`, older tool results are replaced by a stub, oldest first, then
+    the recent tool results and finally the assistant's own text are truncated, oldest first.
+    System and user messages are kept as they are, and tool messages are never dropped, so every tool call in
+    the history keeps its matching response.
+    """
+    tool_indexes = [index for index, message in enumerate(messages) if isinstance(message, ToolMessage)]
+    older = set(tool_indexes[:-keep_recent] if keep_recent else tool_indexes)
+
+    compacted = list(messages)
+    # Duplicate index -> index of the surviving copy
+    duplicates: dict[int, int] = {}
+    seen_payloads: dict[str, int] = {}
+    # Newest first, so the copy that survives deduplication is the one closest to the end of the prompt
+    for index in reversed(tool_indexes):
+        message = messages[index]
+        digest = hashlib.sha256(_text(message).encode()).hexdigest()
+        if digest in seen_payloads:
+            survivor = seen_payloads[digest]
+            compacted[index] = _replace_content(
+                message, f"[Same result as tool call {messages[survivor].tool_call_id} below, omitted]"
+            )
+            duplicates[index] = survivor
+        else:
+            seen_payloads[digest] = index
+
+    url_owners: dict[str, int] = {}
+    for index in sorted(older - duplicates.keys()):
+        message = messages[index]
+        if message.name == "search_internal_news":
+            content = _compact_search_results(_text(message), url_owners, index, summary_chars)
+        else:
+            content = _truncate(_text(message), summary_chars * 2)
+        compacted[index] = _replace_content(message, content)
+
+    def budget_stub(index: int) -> ToolMessage:
+        return _replace_content(
+            messages[index], f"[Older {messages[index].name or 'tool'} result omitted to fit the context budget]"
+        )
+
+    omitted = set()
+    tokens = estimate_tokens(compacted)
+    for index in sorted(older - duplicates.keys()):
+        if tokens <= token_budget:
+            break
+        stub = budget_stub(index)
+        tokens += estimate_tokens([stub]) - estimate_tokens([compacted[index]])
+        compacted[index] = stub
+        omitted.add(index)
+        # Later results must not refer back to articles whose only full copy was just stubbed
+        dropped = {url for url, owner in url_owners.items() if owner == index}
+        if dropped:
+            for later in sorted(older - duplicates.keys() - omitted):
+                if later > index and messages[later].name == "search_internal_news":
+                    compacted[later] = _replace_content(
+                        messages[later], _drop_references(_text(compacted[later]), dropped)
+                    )
+            tokens = estimate_tokens(compacted)
+
+    recent = [index for index in tool_indexes if index not in older and index not in duplicates]
+    omitted |= _truncate_to_budget(compacted, recent, token_budget)
+    assistant_turns = [index for index, message in enumerate(messages) if isinstance(message, AIMessage)]
+    _truncate_to_budget(compacted, assistant_turns, token_budget)
+
+    # A duplicate must not point at a copy whose content was cut to fit the budget.
+    # This stub is shorter than the reference it replaces, so the prompt stays within budget.
+    for index, survivor in duplicates.items():
+        if survivor in omitted:
+            compacted[index] = _replace_content(messages[index], "[Result omitted to fit the context budget]")
+
+    return compacted
@@ -0,0 +1,162 @@
+import hashlib
+import logging
+import uuid
+
+import django_rq
+from django.conf import settings
+from redis import Redis
+from redis.exceptions import WatchError
+from rq.exceptions import NoSuchJobError
+from rq.job import Callback, Job, JobStatus
+from rq.queue import Queue
+from rq.results import Result
+from rq.serializers import resolve_serializer
+
+from .connections import get_async_redis
+from .constants import HIGH_PRIORITY_QUEUE
+from .logic import ask_agent
+
+logger = logging.getLogger(__name__)
+
+DEDUPE_KEY_PREFIX = "analysis:dedupe:"
+
+
+def normalize_query(query: str) -> str:
+    # Case and whitespace differences should not produce a separate LLM run
+    return " ".join(query.split()).casefold()
+
+
+def get_dedupe_key(query: str, idempotency_key: str | None = None) -> str:
+    digest = hashlib.sha256(normalize_query(query).encode())
+    if idempotency_key:
+        digest.update(b"\x00" + idempotency_key.encode())
+    return f"{DEDUPE_KEY_PREFIX}{digest.hexdigest()}"
+
+
+def _is_reusable(job: Job) -> bool:
+    # Failed/stopped/canceled jobs should be retried instead of handed back to the client
+    return not (job.is_failed or job.is_stopped or job.is_canceled)
+
+
+def _discard_dedupe_key(connection: Redis, key: str, job_id: str) -> None:
+    """Delete the dedupe entry only if it still points at `job_id`."""
+    with connection.pipeline() as pipe:
+        try:
+            pipe.watch(key)
+            current = pipe.get(key)
+            if current is not None and current.decode() == job_id:
+                pipe.multi()
+                pipe.delete(key)
+                pipe.execute()
+        except WatchError:
+            # Someone else replaced the entry in the meantime, leave it alone
+            pass
+
+
+def on_analysis_success(job: Job, connection: Redis, result: object, *args, **kwargs) -> None:
+    key = job.meta.get("dedupe_key")
+    if key:
+        # Shrink the in-flight TTL down to the dedupe window, counted from completion
+        connection.expire(key, settings.ANALYSIS_DEDUPE_WINDOW)
+
+
+def on_analysis_failure(job: Job, connection: Redis, *exc_info) -> None:
+    key = job.meta.get("dedupe_key")
+    if key:
+        _discard_dedupe_key(connection, key, job.id)
+
+
+def _create_analysis_job(queue: Queue, query: str, key: str) -> Job:
+    """Save the job hash without enqueueing it, so it can be fetched as soon as the dedupe key points at it."""
+    job = queue.create_job(
+        ask_agent,
+        args=(query,),
+        job_id=uuid.uuid4().hex,
+        meta={"dedupe_key": key},
+        status=JobStatus.CREATED,
+        result_ttl=settings.ANALYSIS_RESULT_TTL,
+        failure_ttl=settings.ANALYSIS_FAILURE_TTL,
+        on_success=Callback(on_analysis_success),
+        on_failure=Callback(on_analysis_failure),
+    )
+    job.save()
+    return job
+
+
+def submit_analysis(query: str, idempotency_key: str | None = None) -> tuple[Job, bool]:
+    """
+    Enqueue `ask_agent` for the query, or attach to an identical in-flight/recent job.
+    Returns the job and whether a new one was created.
+    """
+    queue = django_rq.get_queue(HIGH_PRIORITY_QUEUE)
+    connection = queue.connection
+    key = get_dedupe_key(query, idempotency_key)
+
+    for _ in range(3):
+        existing_id = connection.get(key)
+        if existing_id is not None:
+            existing_id = existing_id.decode()
+            try:
+                job = Job.fetch(existing_id, connection=connection)
+            except NoSuchJobError:
+                job = None
+
+            if job is not None and _is_reusable(job):
+                return job, False
+
+            # The job behind a claim is always saved before the claim is made, so a missing job is stale
+            _discard_dedupe_key(connection, key, existing_id)
+
+        job = _create_analysis_job(queue, query, key)
+        # NX makes the claim atomic: only one of several concurrent duplicates gets to enqueue
+        if connection.set(key, job.id, nx=True, ex=settings.ANALYSIS_DEDUPE_INFLIGHT_TTL):
+            return queue.enqueue_job(job), True
+
+        # Lost the race; drop our unqueued job and attach to the winner's on the next pass
+        job.delete()
+
+    logger.warning(f"Could not claim dedupe key {key}, enqueueing without deduplication.")
+    job = queue.enqueue(
+        ask_agent,
+        query,
+        result_ttl=settings.ANALYSIS_RESULT_TTL,
+        failure_ttl=settings.ANALYSIS_FAILURE_TTL,
+    )
+    return job, True
+
+
+def _build_status(status: bytes, latest_result: list) -> dict:
+    status = status.decode()
+    result = None
+    if latest_result:
+        result_id, payload = latest_result[0]
+        serializer = resolve_serializer(settings.RQ_QUEUES[HIGH_PRIORITY_QUEUE].get("SERIALIZER"))
+        result = Result.restore("", result_id.decode(), payload, connection=None, serializer=serializer)
+
+    if status == JobStatus.FINISHED:
+        return {"status": "completed", "data": result.return_value if result else None}
+    if status == JobStatus.FAILED:
+        return {"status": "failed", "error": str(result.exc_string if result else None)}
+    return {"status": status}
+
+
+async def afetch_job_statuses(task_ids: list[str]) -> dict[str, dict | None]:
+    """
+    Look up the status (and result, if any) of many jobs in one pipelined Redis round trip.
+    Jobs that do not exist map to None.
+    """
+    if not task_ids:
+        return {}
+
+    connection = get_async_redis()
+    async with connection.pipeline(transaction=False) as pipe:
+        for task_id in task_ids:
+            pipe.hget(Job.key_for(task_id), "status")
+            pipe.xrevrange(Result.get_key(task_id), "+", "-", count=1)
+        replies = await pipe.execute()
+
+    statuses = {}
+    for index, task_id in enumerate(task_ids):
+        status, latest_result = replies[2 * index], replies[2 * index + 1]
+        statuses[task_id] = _build_status(status, latest_result) if status else None
+    return statuses
@@ -0,0 +1,172 @@
+import hashlib
+import json
+import logging
+import time
+import uuid
+from collections.abc import Sequence
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from redis import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "llm_cache:"
+ENTRY_PREFIX = f"{KEY_PREFIX}entry:"
+# Sorted set of entry keys scored by last use, for size-bounded LRU eviction
+INDEX_KEY = f"{KEY_PREFIX}index"
+STATS_KEY = f"{KEY_PREFIX}stats"
+
+
+def _digest(payload: object) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()).hexdigest()
+
+
+def canonicalize_messages(messages: Sequence[BaseMessage]) -> list[dict]:
+    """
+    The parts of each message the model actually sees. Message ids and response metadata are dropped, and
+    tool call ids (random per run) are replaced by their order of appearance so identical histories match.
+    """
+    aliases: dict[str, str] = {}
+
+    def alias(call_id: str | None) -> str | None:
+        if call_id is None:
+            return None
+        return aliases.setdefault(call_id, f"call-{len(aliases)}")
+
+    canonical = []
+    for message in messages:
+        entry = {"type": message.type, "content": message.content, "name": message.name}
+        if isinstance(message, AIMessage) and message.tool_calls:
+            entry["tool_calls"] = [
+                {"name": call["name"], "args": call["args"], "id": alias(call.get("id"))}
+                for call in message.tool_calls
+            ]
+        tool_call_id = getattr(message, "tool_call_id", None)
+        if tool_call_id is not None:
+            entry["tool_call_id"] = alias(tool_call_id)
+        canonical.append(entry)
+    return canonical
+
+
+class LLMCache:
+    """
+    Exact-match cache of chat model responses in Redis, including intermediate tool-calling steps.
+    Only sound for deterministic calls (temperature 0): the key covers the model, its bound tools and
+    parameters, and the full message history.
+    """
+
+    def __init__(
+        self,
+        connection: Redis,
+        model_name: str,
+        tools: Sequence,
+        params: dict | None = None,
+        ttl: int = 86400,
+        max_entries: int = 10_000,
+    ):
+        self.connection = connection
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.fingerprint = _digest({
+            "model": model_name,
+            "tools": [convert_to_openai_tool(tool) for tool in tools],
+            "params": params or {},
+        })
+
+    def make_key(self, messages: Sequence[BaseMessage]) -> str:
+        return f"{ENTRY_PREFIX}{_digest([self.fingerprint, canonicalize_messages(messages)])}"
+
+    def get(self, key: str) -> AIMessage | None:
+        # A hit refreshes both the LRU score and the TTL, so the index and the live keys stay in step
+        with self.connection.pipeline() as pipe:
+            pipe.get(key)
+            pipe.expire(key, self.ttl)
+            pipe.zadd(INDEX_KEY, {key: time.time()}, xx=True, ch=True)
+            data, _, indexed = pipe.execute()
+        if data is None:
+            if indexed:
+                # The entry expired before its index member was trimmed
+                self.connection.zrem(INDEX_KEY, key)
+            return None
+
+        message = messages_from_dict([json.loads(data)])[0]
+        # Fresh tool call ids, so a replayed step never collides with ids already in the history
+        for call in message.tool_calls:
+            call["id"] = str(uuid.uuid4())
+        message.response_metadata["llm_cache_hit"] = True
+        return message
+
+    def set(self, key: str, message: AIMessage) -> None:
+        now = time.time()
+        with self.connection.pipeline() as pipe:
+            pipe.set(key, json.dumps(message_to_dict(message)), ex=self.ttl)
+            pipe.zadd(INDEX_KEY, {key: now})
+            # Entries past their TTL are already gone from Redis
+            pipe.zremrangebyscore(INDEX_KEY, "-inf", now - self.ttl)
+            pipe.zcard(INDEX_KEY)
+            size = pipe.execute()[-1]
+
+        if size > self.max_entries:
+            evicted = [member for member, _ in self.connection.zpopmin(INDEX_KEY, size - self.max_entries)]
+            if evicted:
+                self.connection.delete(*evicted)
+
+    def invoke(self, model: Runnable | BaseChatModel, messages: Sequence[BaseMessage]) -> BaseMessage:
+        """`model.invoke(messages)`, served from the cache when the same call was made before."""
+        try:
+            key = self.make_key(messages)
+            cached = self.get(key)
+        except RedisError as e:
+            logger.warning(f"LLM cache unavailable, calling the model directly: {e}")
+            return model.invoke(messages)
+
+        if cached is not None:
+            self._record(hit=True, tokens=(cached.usage_metadata or {}).get("total_tokens", 0))
+            return cached
+
+        response = model.invoke(messages)
+        self._record(hit=False)
+        # Don't pin an empty (failed) generation for the whole TTL
+        if isinstance(response, AIMessage) and (response.content or response.tool_calls):
+            try:
+                self.set(key, response)
+            except RedisError as e:
+                logger.warning(f"Failed to store LLM response in cache: {e}")
+        return response
+
+    def _record(self, hit: bool, tokens: int = 0) -> None:
+        try:
+            with self.connection.pipeline() as pipe:
+                pipe.hincrby(STATS_KEY, "hits" if hit else "misses", 1)
+                if tokens:
+                    pipe.hincrby(STATS_KEY, "tokens_saved", tokens)
+                pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to record LLM cache metrics: {e}")
+
+
+def get_cache_stats(connection: Redis) -> dict:
+    """Hit-rate metrics shared by every worker using the cache."""
+    with connection.pipeline() as pipe:
+        pipe.hgetall(STATS_KEY)
+        pipe.zcard(INDEX_KEY)
+        counters, entries = pipe.execute()
+
+    counters = {field.decode(): int(value) for field, value in counters.items()}
+    hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 4) if hits + misses else None,
+        "tokens_saved": counters.get("tokens_saved", 0),
+        "entries": entries,
+    }
+
+
+def clear_cache(connection: Redis) -> None:
+    keys = connection.zrange(INDEX_KEY, 0, -1)
+    connection.delete(INDEX_KEY, STATS_KEY, *keys)
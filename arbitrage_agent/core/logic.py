@@ -1,26 +1,48 @@
 import operator
 from typing import Annotated, TypedDict
 
+import django_rq
 from django.conf import settings
 from django_rq import job
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import ToolNode
+from rq import get_current_job
 
-from .tools import get_crypto_price, search_internal_news
+from arbitrage_agent.apps.transcripts.utils import save_transcript
+
+from .constants import HIGH_PRIORITY_QUEUE
+from .context import compact_messages
+from .llm_cache import LLMCache
+from .tools import get_crypto_price, get_price_stats, search_internal_news
 
 
 class AgentState(TypedDict):
     # NOTE: 'operator.add' ensures new messages are appended to history, not overwriting it
     messages: Annotated[list[BaseMessage], operator.add]
+    # Compacted view of `messages` that is actually sent to the LLM; replaced on every step
+    context: list[BaseMessage]
 
 
 def build_agent_graph() -> StateGraph:
+    def context_node(state: AgentState) -> AgentState:
+        """Trim older tool results so the prompt stays within the token budget."""
+        context = compact_messages(
+            state['messages'],
+            token_budget=settings.AGENT_CONTEXT_TOKEN_BUDGET,
+            keep_recent=settings.AGENT_CONTEXT_KEEP_RECENT,
+        )
+        return {"context": context}
+
     def agent_node(state: AgentState) -> AgentState:
         """The thinking step: LLM decides what to do based on history."""
-        messages = state['messages']
-        response = model.invoke(messages)
+        messages = state['context']
+        if llm_cache is not None:
+            # Identical histories produce identical output at temperature 0, including tool-calling steps
+            response = llm_cache.invoke(model, messages)
+        else:
+            response = model.invoke(messages)
         return {"messages": [response]}
 
     def evaluate_agent_state(state: AgentState) -> str:
@@ -32,30 +54,44 @@ def build_agent_graph() -> StateGraph:
 
         return END
 
-    tools = [search_internal_news, get_crypto_price]
+    tools = [search_internal_news, get_crypto_price, get_price_stats]
     tool_node = ToolNode(tools)
 
-    model = ChatGoogleGenerativeAI(model="gemini-2.5-flash", api_key=settings.GEMINI_API_KEY, temperature=0)
+    model_name = "gemini-2.5-flash"
+    model = ChatGoogleGenerativeAI(model=model_name, api_key=settings.GEMINI_API_KEY, temperature=0)
     model = model.bind_tools(tools)
 
+    llm_cache = None
+    if settings.LLM_CACHE_ENABLED:
+        llm_cache = LLMCache(
+            django_rq.get_connection(HIGH_PRIORITY_QUEUE),
+            model_name,
+            tools,
+            params={"temperature": 0},
+            ttl=settings.LLM_CACHE_TTL,
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+        )
+
     workflow = StateGraph(AgentState)
 
+    workflow.add_node("context", context_node)
     workflow.add_node("agent", agent_node)
     workflow.add_node("tools", tool_node)
 
-    workflow.add_edge(START, "agent")
+    workflow.add_edge(START, "context")
+    workflow.add_edge("context", "agent")
     workflow.add_conditional_edges(
         "agent",
         evaluate_agent_state
     )
-    workflow.add_edge("tools", "agent")
+    workflow.add_edge("tools", "context")
 
     return workflow.compile()
 
 # Initialize the graph ONCE when the server starts
 agent_app = build_agent_graph()
 
-@job
+@job(HIGH_PRIORITY_QUEUE)
 def ask_agent(user_query: str) -> str:
     system_instruction = SystemMessage(content="""
         You are a senior crypto analyst.
@@ -64,6 +100,7 @@ def ask_agent(user_query: str) -> str:
         PROTOCOL:
         1. ALWAYS search the internal news database (RAG) first.
         2. If news is relevant, check the current price using the tool.
+           Use the price stats tool to judge momentum and whether a spread is persistent.
         3. Synthesize both to answer if there is an opportunity.
         4. If you use a tool, cite it in your final answer.
     """)
@@ -75,4 +112,9 @@ def ask_agent(user_query: str) -> str:
         ]
     })
 
+    # Only the final answer goes back through Redis; the full history is kept in Postgres for auditing
+    current_job = get_current_job()
+    if current_job is not None:
+        save_transcript(current_job.id, user_query, final_state["messages"])
+
     return final_state["messages"][-1].content
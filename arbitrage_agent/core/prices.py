@@ -0,0 +1,249 @@
+import logging
+import mmap
+import multiprocessing
+import os
+import signal
+import time
+
+import numpy as np
+import requests
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Source name used for CryptoCompare's cross-exchange aggregate price
+AGGREGATE_SOURCE = "CCCAGG"
+
+
+class PriceRingBuffer:
+    """
+    Fixed-size buffer of (timestamp, price) ticks for one asset on one source.
+
+    The arrays live in an anonymous shared mapping, so workers forked after the buffer is created read the
+    parent's ticks live, without copying. There is a single writer (the sampler); a reader racing it may at
+    worst see the newest slot half-written, which is acceptable for windowed statistics.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._mmap = mmap.mmap(-1, 8 * (1 + 2 * capacity))
+        self._count = np.frombuffer(self._mmap, dtype=np.int64, count=1)
+        self._times = np.frombuffer(self._mmap, dtype=np.float64, count=capacity, offset=8)
+        self._prices = np.frombuffer(self._mmap, dtype=np.float64, count=capacity, offset=8 * (1 + capacity))
+
+    def __len__(self) -> int:
+        return min(int(self._count[0]), self.capacity)
+
+    def append(self, timestamp: float, price: float) -> None:
+        index = int(self._count[0]) % self.capacity
+        self._times[index] = timestamp
+        self._prices[index] = price
+        # Publish the tick only once both values are written
+        self._count[0] += 1
+
+    def snapshot(self) -> tuple[np.ndarray, np.ndarray]:
+        """Copy of all buffered ticks, oldest first."""
+        count = int(self._count[0])
+        if count <= self.capacity:
+            return self._times[:count].copy(), self._prices[:count].copy()
+
+        head = count % self.capacity
+        return (
+            np.concatenate((self._times[head:], self._times[:head])),
+            np.concatenate((self._prices[head:], self._prices[:head])),
+        )
+
+    def window(self, since: float) -> tuple[np.ndarray, np.ndarray]:
+        times, prices = self.snapshot()
+        start = np.searchsorted(times, since)
+        return times[start:], prices[start:]
+
+
+class PriceHistory:
+    """Ring buffers for every tracked (asset, source) pair; the set of pairs is fixed before workers fork."""
+
+    def __init__(self, assets: list[str], sources: list[str], capacity: int):
+        self.assets = [asset.upper() for asset in assets]
+        self.sources = [AGGREGATE_SOURCE, *sources]
+        self.buffers = {
+            (asset, source): PriceRingBuffer(capacity) for asset in self.assets for source in self.sources
+        }
+
+    def get(self, asset: str, source: str = AGGREGATE_SOURCE) -> PriceRingBuffer | None:
+        return self.buffers.get((asset.upper(), source))
+
+    def record(self, asset: str, source: str, timestamp: float, price: float) -> None:
+        buffer = self.get(asset, source)
+        if buffer is not None:
+            buffer.append(timestamp, price)
+
+
+def compute_window_stats(times: np.ndarray, prices: np.ndarray) -> dict | None:
+    if len(prices) < 2:
+        return None
+
+    log_returns = np.diff(np.log(prices))
+    return {
+        "last": float(prices[-1]),
+        "return_pct": float((prices[-1] / prices[0] - 1) * 100),
+        # Realized volatility over the window
+        "volatility_pct": float(np.sqrt(np.sum(log_returns ** 2)) * 100),
+        "high": float(prices.max()),
+        "low": float(prices.min()),
+        "ticks": int(len(prices)),
+        "span_seconds": float(times[-1] - times[0]),
+    }
+
+
+def compute_spread_stats(
+    reference: tuple[np.ndarray, np.ndarray], other: tuple[np.ndarray, np.ndarray], threshold_bps: float
+) -> dict | None:
+    """Spread of `other` against `reference` over the ticks sampled at the same time on both."""
+    _, reference_index, other_index = np.intersect1d(reference[0], other[0], return_indices=True)
+    if not len(reference_index):
+        return None
+
+    reference_prices = reference[1][reference_index]
+    spread_bps = (other[1][other_index] - reference_prices) / reference_prices * 10_000
+    return {
+        "last_bps": float(spread_bps[-1]),
+        "mean_bps": float(spread_bps.mean()),
+        # Share of samples where the spread was at least the threshold: close to 1 means a persistent dislocation
+        "persistence": float(np.mean(np.abs(spread_bps) >= threshold_bps)),
+        "samples": int(len(spread_bps)),
+    }
+
+
+def get_window_stats(history: PriceHistory, asset: str, window_seconds: float, now: float | None = None) -> dict | None:
+    """Windowed stats for the asset's aggregate price plus spread persistence for each exchange."""
+    aggregate = history.get(asset)
+    if aggregate is None:
+        return None
+
+    since = (now or time.time()) - window_seconds
+    reference = aggregate.window(since)
+    stats = compute_window_stats(*reference)
+    if stats is None:
+        return None
+
+    spreads = {}
+    for source in history.sources[1:]:
+        other = history.get(asset, source).window(since)
+        spread = compute_spread_stats(reference, other, settings.PRICE_SPREAD_THRESHOLD_BPS)
+        if spread is not None:
+            spreads[source] = spread
+
+    return {"asset": asset.upper(), "window_seconds": window_seconds, **stats, "spreads": spreads}
+
+
+def build_bars(
+    times: np.ndarray, prices: np.ndarray, resolution: int, since: float = 0, complete_from: float = 0
+) -> list[dict]:
+    """
+    Downsample ticks into OHLC bars of `resolution` seconds, for buckets that end after `since`.
+    Buckets starting before `complete_from` are skipped, as some of their ticks are no longer buffered.
+    """
+    if not len(times):
+        return []
+
+    buckets = (times // resolution) * resolution
+    starts, first_index, counts = np.unique(buckets, return_index=True, return_counts=True)
+    last_index = first_index + counts - 1
+    highs = np.maximum.reduceat(prices, first_index)
+    lows = np.minimum.reduceat(prices, first_index)
+
+    bars = []
+    for i, start in enumerate(starts):
+        if start + resolution <= since or start < complete_from:
+            continue
+        bars.append({
+            "bucket_start": float(start),
+            "open": float(prices[first_index[i]]),
+            "high": float(highs[i]),
+            "low": float(lows[i]),
+            "close": float(prices[last_index[i]]),
+            "tick_count": int(counts[i]),
+        })
+    return bars
+
+
+def fetch_prices(assets: list[str], source: str) -> dict[str, float]:
+    """One CryptoCompare request for the USD price of every asset on the given source."""
+    url = "https://min-api.cryptocompare.com/data/pricemulti"
+    params = {"fsyms": ",".join(assets), "tsyms": "USD"}
+    if source != AGGREGATE_SOURCE:
+        params["e"] = source
+
+    response = requests.get(url, params=params, timeout=5)
+    response.raise_for_status()
+    data = response.json()
+    return {asset: float(quote["USD"]) for asset, quote in data.items() if isinstance(quote, dict) and "USD" in quote}
+
+
+class PriceSampler(multiprocessing.context.ForkProcess):
+    """
+    Polls prices into a `PriceHistory` and periodically flushes OHLC bars to Postgres.
+
+    Runs as its own forked process rather than a thread of the worker pool parent: the pool keeps forking
+    workers, and forking while a sampler thread holds a lock (HTTP connection pool, DB connection, logging)
+    could leave that lock held forever in the child. The tick buffers are shared memory, so the sampler's
+    writes are visible to the pool and every worker.
+    """
+
+    def __init__(self, history: PriceHistory, sample_interval: float, flush_interval: float):
+        super().__init__(name="price-sampler", daemon=True)
+        self.history = history
+        self.sample_interval = sample_interval
+        self.flush_interval = flush_interval
+        self._stop_event = multiprocessing.get_context("fork").Event()
+        self._parent_pid = os.getpid()
+        self._last_flush = time.time()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def sample(self) -> None:
+        # Every source is stamped with the same time so spreads can be computed tick by tick
+        timestamp = time.time()
+        for source in self.history.sources:
+            try:
+                prices = fetch_prices(self.history.assets, source)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning(f"Failed to sample prices from {source}: {e}")
+                continue
+            for asset, price in prices.items():
+                self.history.record(asset, source, timestamp, price)
+
+    def flush(self) -> None:
+        from arbitrage_agent.apps.prices.utils import store_bars
+
+        since, self._last_flush = self._last_flush, time.time()
+        store_bars(self.history, settings.PRICE_BAR_RESOLUTIONS, since)
+
+    def run(self) -> None:
+        # Ctrl-C reaches the whole process group; the pool parent decides when the sampler stops
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        # Stop as well if the pool parent went away without stopping us
+        while not self._stop_event.is_set() and os.getppid() == self._parent_pid:
+            self.sample()
+            if time.time() - self._last_flush >= self.flush_interval:
+                self.flush()
+            self._stop_event.wait(self.sample_interval)
+
+
+_price_history: PriceHistory | None = None
+
+
+def get_price_history() -> PriceHistory:
+    global _price_history
+    if _price_history is None:
+        _price_history = PriceHistory(
+            settings.PRICE_HISTORY_ASSETS, settings.PRICE_HISTORY_EXCHANGES, settings.PRICE_HISTORY_CAPACITY
+        )
+    return _price_history
+
+
+def start_price_sampler() -> PriceSampler:
+    sampler = PriceSampler(get_price_history(), settings.PRICE_SAMPLE_INTERVAL, settings.PRICE_FLUSH_INTERVAL)
+    sampler.start()
+    return sampler
@@ -1,14 +1,26 @@
 import json
+from datetime import timedelta
 
 import requests
 from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
 from langchain.tools import tool
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from pgvector.django import CosineDistance
 
 from arbitrage_agent.apps.news_articles.models import NewsArticle
+from arbitrage_agent.apps.prices.utils import load_bar_closes
 
 from .constants import EMBEDDING_MODEL, EMBEDDING_SIZE
+from .prices import compute_window_stats, get_price_history, get_window_stats
+
+
+def find_similar_articles(query_vector: list[float], limit: int = 3) -> QuerySet[NewsArticle]:
+    """Nearest articles by cosine distance; the retrieval step of `search_internal_news`."""
+    return NewsArticle.objects.annotate(
+        distance=CosineDistance('embedding', query_vector)
+    ).order_by('distance')[:limit]
 
 
 @tool
@@ -31,11 +43,7 @@ def search_internal_news(query: str) -> str:
         api_key=settings.GEMINI_API_KEY,
     )
     query_vector = embeddings.embed_query(query)
-
-    # Perform Vector Search using pgvector's L2 distance operator (<->)
-    results = NewsArticle.objects.annotate(
-        distance=CosineDistance('embedding', query_vector)
-    ).order_by('distance')[:3] # Get top 3 results
+    results = find_similar_articles(query_vector)
 
     if not results:
         return "No relevant news found."
@@ -61,3 +69,26 @@ def get_crypto_price(ticker: str) -> str:
             return "Could not fetch price."
     except (ConnectionError, TimeoutError, json.JSONDecodeError) as e:
         return f"Error fetching price: {e}"
+
+@tool
+def get_price_stats(ticker: str, window_minutes: int = 60) -> str:
+    """
+    Useful for judging momentum and whether a cross-exchange spread is persistent.
+    Returns the return, realized volatility, high and low of a cryptocurrency over the last `window_minutes`,
+    plus each exchange's spread against the cross-exchange average and how often it exceeded the threshold.
+    Input should be a ticker like 'BTC' or 'ETH'.
+    """
+    window_seconds = window_minutes * 60
+    stats = get_window_stats(get_price_history(), ticker, window_seconds)
+
+    if stats is None:
+        # This process has no live tick buffer (e.g. not running under the worker pool); use stored bars
+        times, prices = load_bar_closes(ticker, timezone.now() - timedelta(seconds=window_seconds))
+        bar_stats = compute_window_stats(times, prices)
+        if bar_stats is not None:
+            stats = {"asset": ticker.upper(), "window_seconds": window_seconds, **bar_stats, "spreads": {}}
+
+    if stats is None:
+        return f"No recent price history for {ticker}."
+
+    return json.dumps(stats)
@@ -0,0 +1,151 @@
+import logging
+import math
+import multiprocessing
+import time
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.db import connections
+from redis import Redis
+from rq import Queue
+from rq.worker import WorkerStatus
+from rq.worker_pool import WorkerPool, run_worker
+
+from .prices import PriceSampler, get_price_history, start_price_sampler
+
+logger = logging.getLogger(__name__)
+
+
+class QueueDepthScaler:
+    """
+    Decides how many workers a pool should run based on the number of jobs waiting in its queues.
+    Scales up straight to the target, but only steps down one worker per decision to avoid flapping.
+    """
+
+    def __init__(
+        self,
+        connection: Redis,
+        queue_names: Iterable[str],
+        min_workers: int = 1,
+        max_workers: int = 4,
+        jobs_per_worker: int = 5,
+    ):
+        if min_workers < 0 or max_workers < max(min_workers, 1):
+            raise ValueError(f"Invalid worker bounds: min={min_workers}, max={max_workers}")
+
+        self.connection = connection
+        self.queue_names = list(queue_names)
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.jobs_per_worker = max(jobs_per_worker, 1)
+
+    def get_backlog(self) -> int:
+        return sum(Queue(name, connection=self.connection).count for name in self.queue_names)
+
+    def desired_workers(self, current: int) -> int:
+        target = math.ceil(self.get_backlog() / self.jobs_per_worker)
+        target = min(max(target, self.min_workers), self.max_workers)
+
+        if target < current:
+            return max(current - 1, target)
+        return target
+
+
+class PreforkWorkerPool(WorkerPool):
+    """
+    RQ worker pool that forks its workers from an already-warmed parent, so the compiled agent graph and
+    model clients are shared copy-on-write, and resizes itself using a `QueueDepthScaler`.
+    """
+
+    def __init__(
+        self,
+        *args,
+        scaler: QueueDepthScaler | None = None,
+        scale_interval: float = 10,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.scaler = scaler
+        self.scale_interval = scale_interval
+        self._last_scaled_at = 0.0
+        # Workers that were asked to shut down but are still finishing their current job
+        self._draining: set[str] = set()
+
+    @staticmethod
+    def warm_up() -> PriceSampler | None:
+        """Prepare the parent before any worker is forked; returns the price sampler process, if enabled."""
+        # Importing the logic module builds the LangGraph app and the Gemini clients in the parent
+        from arbitrage_agent.core import logic  # noqa: F401
+
+        # Price tick buffers are shared memory: allocated here, written by the sampler process, and read live
+        # by every forked worker
+        get_price_history()
+
+        # Forked children (the sampler included) must not share the parent's database sockets
+        connections.close_all()
+
+        if settings.PRICE_HISTORY_ENABLED:
+            return start_price_sampler()
+        return None
+
+    def get_worker_process(self, name: str, burst: bool, _sleep: float = 0, logging_level: str = 'INFO'):
+        # Always fork (never spawn) so the warmed-up parent memory is inherited
+        return multiprocessing.get_context("fork").Process(
+            target=run_worker,
+            args=(name, self._queue_names, self._connection_class, self._pool_class, self._pool_kwargs),
+            kwargs={
+                '_sleep': _sleep,
+                'burst': burst,
+                'logging_level': logging_level,
+                'worker_class': self.worker_class,
+                'job_class': self.job_class,
+                'serializer': self.serializer,
+            },
+            name=f'Worker {name} (WorkerPool {self.name})',
+        )
+
+    @property
+    def number_of_serving_workers(self) -> int:
+        return len(self.worker_dict.keys() - self._draining)
+
+    def handle_dead_worker(self, worker_data) -> None:
+        super().handle_dead_worker(worker_data)
+        self._draining.discard(worker_data.name)
+
+    def is_busy(self, worker_data) -> bool:
+        worker = self.worker_class.find_by_key(
+            f"{self.worker_class.redis_worker_namespace_prefix}{worker_data.name}",
+            connection=self.connection,
+            serializer=self.serializer,
+        )
+        # A worker that has not registered yet cannot be running a job
+        return worker is not None and worker.get_state() == WorkerStatus.BUSY
+
+    def scale(self) -> None:
+        current = self.num_workers
+        desired = self.scaler.desired_workers(current)
+        if desired == current:
+            return
+
+        logger.info(f"Scaling worker pool from {current} to {desired} workers.")
+        if desired < current:
+            serving = [data for name, data in self.worker_dict.items() if name not in self._draining]
+            # Idle workers first (newest first among equals): draining a busy one delays the shrink by a whole job
+            candidates = sorted(reversed(serving), key=self.is_busy)
+            for worker_data in candidates[:len(serving) - desired]:
+                # SIGINT is a warm shutdown: the worker finishes its current job first
+                self.stop_worker(worker_data)
+                self._draining.add(worker_data.name)
+
+        self.num_workers = desired
+
+    def check_workers(self, respawn: bool = True) -> None:
+        # `num_workers` counts serving workers only; draining ones are reaped once their job is done
+        self.reap_workers()
+        if respawn and self.status != self.Status.STOPPED:
+            if self.scaler and time.monotonic() - self._last_scaled_at >= self.scale_interval:
+                self._last_scaled_at = time.monotonic()
+                self.scale()
+
+            for _ in range(self.num_workers - self.number_of_serving_workers):
+                self.start_worker(burst=self._burst, _sleep=self._sleep)
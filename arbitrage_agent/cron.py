@@ -7,11 +7,12 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "arbitrage_agent.settings")
 django.setup()
 
 from arbitrage_agent.apps.news_articles.utils import fetch_and_store_news
+from arbitrage_agent.core.constants import LOW_PRIORITY_QUEUE  # noqa: E402
 
 # Register the cron job
 cron.register(
     fetch_and_store_news,
     cron="0 * * * *",  # Run at the start of every hour
     kwargs={'batch_size': 20, 'commit': True},
-    queue_name="default",
+    queue_name=LOW_PRIORITY_QUEUE,
 )
@@ -39,6 +39,8 @@ INSTALLED_APPS = [
 
     # Local
     "arbitrage_agent.apps.news_articles",
+    "arbitrage_agent.apps.transcripts",
+    "arbitrage_agent.apps.prices",
 ]
 
 MIDDLEWARE = [
@@ -69,6 +71,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "arbitrage_agent.wsgi.application"
+ASGI_APPLICATION = "arbitrage_agent.asgi.application"
 
 
 # Database
@@ -154,17 +157,77 @@ CACHES = {
     }
 }
 
+# Max pooled async Redis connections per process for the status endpoints
+ASYNC_REDIS_MAX_CONNECTIONS = int(os.getenv("ASYNC_REDIS_MAX_CONNECTIONS", 50))
+
 # Django RQ
+RQ_SERIALIZER = "arbitrage_agent.core.serializers.CompactSerializer"
 RQ_QUEUES = {
+    "high": {
+        "URL": f'redis://:{REDIS_PASSWORD}@{REDIS_HOST}:6379/0',
+        "DEFAULT_TIMEOUT": 500,
+        "SERIALIZER": RQ_SERIALIZER,
+    },
     "default": {
         "URL": f'redis://:{REDIS_PASSWORD}@{REDIS_HOST}:6379/0',
         "DEFAULT_TIMEOUT": 500,
+        "SERIALIZER": RQ_SERIALIZER,
+    },
+    "low": {
+        "URL": f'redis://:{REDIS_PASSWORD}@{REDIS_HOST}:6379/0',
+        "DEFAULT_TIMEOUT": 1800,
+        "SERIALIZER": RQ_SERIALIZER,
     },
 }
 
+# How long (seconds) analysis results and failures are kept in Redis.
+# Full transcripts are kept in Postgres, see `arbitrage_agent.apps.transcripts`.
+ANALYSIS_RESULT_TTL = int(os.getenv("ANALYSIS_RESULT_TTL", 3600))
+ANALYSIS_FAILURE_TTL = int(os.getenv("ANALYSIS_FAILURE_TTL", 86400))
+
+# Worker pool autoscaling (see `run_worker_pool`)
+RQ_POOL_MIN_WORKERS = int(os.getenv("RQ_POOL_MIN_WORKERS", 1))
+RQ_POOL_MAX_WORKERS = int(os.getenv("RQ_POOL_MAX_WORKERS", 4))
+RQ_POOL_JOBS_PER_WORKER = int(os.getenv("RQ_POOL_JOBS_PER_WORKER", 5))
+RQ_POOL_SCALE_INTERVAL = int(os.getenv("RQ_POOL_SCALE_INTERVAL", 10))
+
+# Analysis job deduplication (seconds)
+# How long a completed analysis is handed back for identical submissions
+ANALYSIS_DEDUPE_WINDOW = int(os.getenv("ANALYSIS_DEDUPE_WINDOW", 300))
+# Upper bound on queued + running time before an in-flight claim expires
+ANALYSIS_DEDUPE_INFLIGHT_TTL = int(os.getenv("ANALYSIS_DEDUPE_INFLIGHT_TTL", 3600))
+
 # GEMINI
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", '')
 
+# Minimum cosine similarity for a new article to trigger a standing query analysis
+STANDING_QUERY_DEFAULT_THRESHOLD = float(os.getenv("STANDING_QUERY_DEFAULT_THRESHOLD", 0.75))
+
+# Price history: in-memory tick buffers sampled by the worker pool, flushed to Postgres as OHLC bars
+PRICE_HISTORY_ENABLED = os.getenv("PRICE_HISTORY_ENABLED", "True") == "True"
+PRICE_HISTORY_ASSETS = os.getenv("PRICE_HISTORY_ASSETS", "BTC,ETH,SOL,XRP").split(",")
+PRICE_HISTORY_EXCHANGES = os.getenv("PRICE_HISTORY_EXCHANGES", "Coinbase,Kraken,Bitstamp").split(",")
+# Ticks kept per asset/source; at the default 10s interval 4096 ticks cover ~11 hours
+PRICE_HISTORY_CAPACITY = int(os.getenv("PRICE_HISTORY_CAPACITY", 4096))
+PRICE_SAMPLE_INTERVAL = int(os.getenv("PRICE_SAMPLE_INTERVAL", 10))
+PRICE_FLUSH_INTERVAL = int(os.getenv("PRICE_FLUSH_INTERVAL", 60))
+# Bar widths (seconds) written to Postgres
+PRICE_BAR_RESOLUTIONS = [60, 300, 3600]
+# Cross-exchange spread (basis points) that counts as a dislocation for spread persistence
+PRICE_SPREAD_THRESHOLD_BPS = float(os.getenv("PRICE_SPREAD_THRESHOLD_BPS", 10))
+
+# Agent prompt compaction
+# Approximate token cap for the prompt sent to the LLM on each step
+AGENT_CONTEXT_TOKEN_BUDGET = int(os.getenv("AGENT_CONTEXT_TOKEN_BUDGET", 6000))
+# Most recent tool results passed to the LLM verbatim
+AGENT_CONTEXT_KEEP_RECENT = int(os.getenv("AGENT_CONTEXT_KEEP_RECENT", 2))
+
+# Exact-match cache of agent LLM calls (see `arbitrage_agent.core.llm_cache`)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "True") == "True"
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", 86400))
+# Least recently used responses are evicted beyond this many entries
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 10000))
+
 if not os.getenv("DOCKER_CONTAINER"):
     try:
         from .local_settings import *
@@ -18,11 +18,13 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
-from arbitrage_agent.api.views import StartAnalysisView, TaskStatusView
+from arbitrage_agent.api.views import BatchTaskStatusView, StandingQueryView, StartAnalysisView, TaskStatusView
 
 urlpatterns = [
     path('admin/django-rq/', include('django_rq.urls')),
     path("admin/", admin.site.urls),
     path('api/start/', StartAnalysisView.as_view(), name='start_analysis'),
+    path('api/standing-queries/', StandingQueryView.as_view(), name='standing_queries'),
+    path('api/status/', BatchTaskStatusView.as_view(), name='batch_task_status'),
     path('api/status/<str:task_id>/', TaskStatusView.as_view(), name='task_status'),
 ]
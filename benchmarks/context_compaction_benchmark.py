@@ -0,0 +1,88 @@
+"""
+Prompt size benchmark for the agent's context compaction stage.
+
+Replays synthetic multi-step agent runs (repeated news searches with overlapping hits and price checks) and
+reports the estimated prompt tokens paid per answer, summed over every LLM call, with and without compaction.
+
+    python -m benchmarks.context_compaction_benchmark --steps 4 8 16 --budget 6000
+"""
+import argparse
+import json
+import random
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from arbitrage_agent.core.context import compact_messages, estimate_tokens
+
+WORDS = (
+    "bitcoin ethereum solana etf liquidity arbitrage exchange volume spread institutional inflows rally "
+    "regulation stablecoin defi upgrade custody treasury market volatility momentum order book pool"
+).split()
+
+
+def make_article(rng: random.Random, article_id: int) -> dict:
+    return {
+        "title": f"Market update #{article_id}",
+        "summary": " ".join(rng.choices(WORDS, k=250)),
+        "url": f"https://www.coindesk.com/markets/article-{article_id}/",
+        "published_at": "2026-01-01 00:00:00",
+    }
+
+
+def simulate_run(steps: int, budget: int, keep_recent: int, seed: int) -> tuple[int, int]:
+    """Returns (tokens without compaction, tokens with compaction) summed over all LLM calls of one answer."""
+    rng = random.Random(seed)
+    # A small corpus so later searches keep hitting articles that were already retrieved
+    corpus = [make_article(rng, article_id) for article_id in range(12)]
+    messages = [
+        SystemMessage(content="You are a senior crypto analyst. You are skeptical, data-driven, and concise."),
+        HumanMessage(content="Is there an arbitrage opportunity on ETH right now?"),
+    ]
+
+    raw_tokens = compacted_tokens = 0
+    for step in range(steps):
+        raw_tokens += estimate_tokens(messages)
+        compacted_tokens += estimate_tokens(compact_messages(messages, budget, keep_recent=keep_recent))
+
+        call_id = f"call-{step}"
+        if step % 3 == 2:
+            tool_name, args, content = "get_crypto_price", {"ticker": "ETH"}, "The current price of ETH is $3120.5"
+        else:
+            query = rng.choice(["eth news", "eth etf", "eth arbitrage"])
+            tool_name, args = "search_internal_news", {"query": query}
+            content = json.dumps(rng.sample(corpus, 3))
+
+        messages.append(AIMessage(content="", tool_calls=[{"name": tool_name, "args": args, "id": call_id}]))
+        messages.append(ToolMessage(content=content, tool_call_id=call_id, name=tool_name))
+
+    # Final answer call
+    raw_tokens += estimate_tokens(messages)
+    compacted_tokens += estimate_tokens(compact_messages(messages, budget, keep_recent=keep_recent))
+    return raw_tokens, compacted_tokens
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, nargs="+", default=[2, 4, 8, 16], help="Tool calls per answer")
+    parser.add_argument("--budget", type=int, default=6000, help="Context token budget")
+    parser.add_argument("--keep-recent", type=int, default=2, help="Tool results kept verbatim")
+    parser.add_argument("--runs", type=int, default=20, help="Simulated answers per step count")
+    args = parser.parse_args()
+
+    results = []
+    for steps in args.steps:
+        totals = [simulate_run(steps, args.budget, args.keep_recent, seed) for seed in range(args.runs)]
+        before = sum(raw for raw, _ in totals) / args.runs
+        after = sum(compacted for _, compacted in totals) / args.runs
+        results.append({
+            "steps": steps,
+            "tokens_per_answer_before": round(before),
+            "tokens_per_answer_after": round(after),
+            "reduction_pct": round(100 * (1 - after / before), 1),
+        })
+
+    print(json.dumps({"budget": args.budget, "keep_recent": args.keep_recent, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Retrieval and ingestion scaling benchmark over a synthetic corpus.
+
+Grows the articles table through each size with `generate_corpus`, then measures ingest throughput,
+vector index build time, table and index size, `search_internal_news` retrieval latency and recall
+against exact search. Results are written as JSON after every size so long runs can be tracked over time.
+
+Run it against a dedicated database: the articles table is truncated first (pass --reset to confirm).
+
+    python -m benchmarks.retrieval_scaling_benchmark --reset --sizes 10000 100000 1000000 5000000 \\
+        --output retrieval_scaling.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import UTC, datetime
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "arbitrage_agent.settings")
+django.setup()
+
+import numpy as np  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+
+from arbitrage_agent.apps.news_articles.corpus import generate_corpus, make_centroids  # noqa: E402
+from arbitrage_agent.apps.news_articles.models import NewsArticle  # noqa: E402
+from arbitrage_agent.core.tools import find_similar_articles  # noqa: E402
+
+TABLE = NewsArticle._meta.db_table
+INDEX_NAME = "news_article_embedding_benchmark_idx"
+INDEX_METHODS = {
+    "hnsw": "USING hnsw (embedding vector_cosine_ops)",
+    "ivfflat": "USING ivfflat (embedding vector_cosine_ops) WITH (lists = {lists})",
+}
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def make_queries(seed: int, clusters: int, count: int, noise: float) -> list[list[float]]:
+    """Query vectors near the corpus centroids, like real questions about covered topics."""
+    centroids = make_centroids(seed, clusters)
+    rng = np.random.default_rng([seed, 1 << 32])
+    queries = centroids[rng.integers(0, clusters, size=count)]
+    queries = queries + rng.standard_normal(queries.shape, dtype=np.float32) * (noise / np.sqrt(queries.shape[1]))
+    return (queries / np.linalg.norm(queries, axis=1, keepdims=True)).tolist()
+
+
+def drop_index() -> None:
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP INDEX IF EXISTS "{INDEX_NAME}"')
+
+
+def build_index(method: str, rows: int, maintenance_work_mem: str | None) -> float:
+    drop_index()
+    if method == "none":
+        return 0.0
+
+    with connection.cursor() as cursor:
+        if maintenance_work_mem:
+            cursor.execute("SELECT set_config('maintenance_work_mem', %s, false)", [maintenance_work_mem])
+        # pgvector's guidance for IVFFlat: rows / 1000 lists up to 1M rows, sqrt(rows) beyond
+        lists = max(1, rows // 1000 if rows <= 1_000_000 else int(rows ** 0.5))
+        started = time.perf_counter()
+        cursor.execute(f'CREATE INDEX "{INDEX_NAME}" ON {TABLE} {INDEX_METHODS[method].format(lists=lists)}')
+        return time.perf_counter() - started
+
+
+def measure_sizes() -> dict:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_relation_size(%s), pg_indexes_size(%s), pg_total_relation_size(%s), "
+            "COALESCE((SELECT pg_relation_size(indexrelid) FROM pg_stat_user_indexes WHERE indexrelname = %s), 0)",
+            [TABLE, TABLE, TABLE, INDEX_NAME],
+        )
+        table_bytes, indexes_bytes, total_bytes, vector_index_bytes = cursor.fetchone()
+    return {
+        "table_bytes": table_bytes,
+        "indexes_bytes": indexes_bytes,
+        "vector_index_bytes": vector_index_bytes,
+        "total_bytes": total_bytes,
+    }
+
+
+def search(query_vector: list[float]) -> list[int]:
+    return [article.pk for article in find_similar_articles(query_vector)]
+
+
+def measure_search(queries: list[list[float]], warmup: int) -> dict:
+    for query_vector in queries[:warmup]:
+        search(query_vector)
+
+    latencies = []
+    for query_vector in queries:
+        started = time.perf_counter()
+        search(query_vector)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "queries": len(latencies),
+        "mean_ms": round(statistics.fmean(latencies), 2),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+
+def measure_recall(queries: list[list[float]]) -> float | None:
+    """Share of the exact top results that the index-backed search also returns."""
+    if not queries:
+        return None
+
+    approximate = [set(search(query_vector)) for query_vector in queries]
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_indexscan = off")
+        exact = [set(search(query_vector)) for query_vector in queries]
+    found = sum(len(a & e) for a, e in zip(approximate, exact, strict=True))
+    return round(found / sum(len(e) for e in exact), 4)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000, 5_000_000], help="Corpus sizes"
+    )
+    parser.add_argument("--index", choices=["hnsw", "ivfflat", "none"], default="hnsw", help="Vector index type")
+    parser.add_argument("--maintenance-work-mem", help="maintenance_work_mem for index builds, e.g. 2GB")
+    parser.add_argument("--queries", type=int, default=200, help="Timed searches per size")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed searches before measuring")
+    parser.add_argument("--recall-queries", type=int, default=20, help="Searches checked against exact search")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--clusters", type=int, default=64)
+    parser.add_argument("--noise", type=float, default=0.6)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Parallel loader processes")
+    parser.add_argument("--output", help="Write results to this JSON file as well as stdout")
+    parser.add_argument("--reset", action="store_true", help="Truncate the articles table before starting")
+    args = parser.parse_args()
+
+    if not args.reset:
+        sys.exit("Refusing to run without --reset: the benchmark truncates the articles table.")
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"TRUNCATE {TABLE} CASCADE")
+        cursor.execute("SELECT version()")
+        postgres_version = cursor.fetchone()[0]
+
+    report = {
+        "benchmark": "retrieval_scaling",
+        "started_at": datetime.now(UTC).isoformat(),
+        "postgres": postgres_version,
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "reset")},
+        "results": [],
+    }
+    queries = make_queries(args.seed, args.clusters, args.queries, args.noise)
+
+    current = 0
+    for size in sorted(args.sizes):
+        # Load without the vector index so ingest and index build are measured separately
+        drop_index()
+        ingest = generate_corpus(
+            size - current,
+            start=current,
+            seed=args.seed,
+            clusters=args.clusters,
+            noise=args.noise,
+            processes=args.processes,
+        )
+        current = size
+
+        index_seconds = build_index(args.index, size, args.maintenance_work_mem)
+        with connection.cursor() as cursor:
+            cursor.execute(f"VACUUM ANALYZE {TABLE}")
+
+        result = {
+            "rows": size,
+            "ingested_rows": ingest["inserted"],
+            "ingest_seconds": ingest["load_seconds"],
+            "ingest_rows_per_sec": ingest["rows_per_sec"],
+            "index": args.index,
+            "index_build_seconds": round(index_seconds, 2),
+            **measure_sizes(),
+            "search": measure_search(queries, args.warmup),
+            "recall_at_3": measure_recall(queries[:args.recall_queries]) if args.index != "none" else None,
+        }
+        report["results"].append(result)
+        print(json.dumps(result), file=sys.stderr)
+
+        if args.output:
+            with open(args.output, "w") as file:
+                json.dump(report, file, indent=2)
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
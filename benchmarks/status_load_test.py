@@ -0,0 +1,88 @@
+"""
+Load test for the task status endpoints.
+
+Simulates many clients polling `api/status/` concurrently against a running server
+(e.g. `docker-compose up`) and reports throughput and latency percentiles.
+
+    python benchmarks/status_load_test.py --task-ids <id1>,<id2> --concurrency 2000 --duration 30
+    python benchmarks/status_load_test.py --task-ids <id1>,<id2> --batch
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+async def poller(client: httpx.AsyncClient, urls: list[str], deadline: float, latencies: list[float], errors: list):
+    index = 0
+    while time.perf_counter() < deadline:
+        url = urls[index % len(urls)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            response = await client.get(url)
+            if response.status_code >= 500:
+                errors.append(response.status_code)
+                continue
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append(time.perf_counter() - started)
+
+
+async def run(base_url: str, task_ids: list[str], concurrency: int, duration: float, batch: bool) -> dict:
+    if batch:
+        urls = [f"{base_url}/api/status/?task_ids={','.join(task_ids)}"]
+    else:
+        urls = [f"{base_url}/api/status/{task_id}/" for task_id in task_ids]
+
+    latencies: list[float] = []
+    errors: list = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        deadline = time.perf_counter() + duration
+        started = time.perf_counter()
+        await asyncio.gather(*(poller(client, urls, deadline, latencies, errors) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "mode": "batch" if batch else "single",
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 2),
+        "requests": len(latencies),
+        "errors": len(errors),
+        "requests_per_s": round(len(latencies) / elapsed, 1),
+        "statuses_per_s": round(len(latencies) * (len(task_ids) if batch else 1) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--task-ids", required=True, help="Comma separated task ids to poll")
+    parser.add_argument("--concurrency", type=int, default=1000, help="Number of concurrent pollers")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run")
+    parser.add_argument("--batch", action="store_true", help="Poll all task ids through the batched endpoint")
+    args = parser.parse_args()
+
+    task_ids = [task_id for task_id in args.task_ids.split(",") if task_id]
+    report = asyncio.run(run(args.base_url.rstrip("/"), task_ids, args.concurrency, args.duration, args.batch))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import csv
+import gzip
+import json
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from arbitrage_agent.apps.news_articles.bulk_import import bulk_import, iter_jsonl, normalize_record, to_csv
+
+
+def record(number: int, **overrides) -> dict:
+    return {
+        "title": f"News {number}",
+        "summary": "ETH rallies",
+        "url": f"https://x.com/{number}",
+        "published_at": "2025-01-02T03:04:05Z",
+        **overrides,
+    }
+
+
+class RecordParsingTest(SimpleTestCase):
+
+    def test_reads_gzipped_jsonl_and_skips_bad_lines(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "news.jsonl.gz"
+            with gzip.open(path, "wt", encoding="utf-8") as file:
+                file.write(json.dumps(record(1)) + "\n\n{not json\n" + json.dumps(record(2)) + "\n")
+
+            with self.assertLogs("arbitrage_agent.apps.news_articles.bulk_import", level="WARNING"):
+                records = list(iter_jsonl(path))
+
+        self.assertEqual([item["url"] for item in records], ["https://x.com/1", "https://x.com/2"])
+
+    def test_normalize_record(self):
+        row = normalize_record(record(1, summary=None))
+        self.assertEqual(row["published_at"], datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC))
+        self.assertEqual(row["summary"], "")
+
+        self.assertIsNone(normalize_record(record(1, url=None)))
+        self.assertIsNone(normalize_record(record(1, published_at="not a date")))
+        self.assertIsNone(normalize_record(record(1, embedding=[0.1, 0.2])))
+
+    def test_normalize_record_rejects_wrong_types(self):
+        self.assertIsNone(normalize_record(["not", "an", "object"]))
+        self.assertIsNone(normalize_record(record(1, url=12345)))
+        self.assertIsNone(normalize_record(record(1, title=["News"])))
+        self.assertIsNone(normalize_record(record(1, summary={"text": "ETH"})))
+        self.assertIsNone(normalize_record(record(1, published_at=20250102)))
+        self.assertIsNone(normalize_record(record(1, embedding=0.5)))
+        self.assertIsNone(normalize_record(record(1, embedding=["0.5"] * 768)))
+        self.assertIsNone(normalize_record(record(1, embedding="0.5")))
+
+    def test_csv_rows_use_vector_literals_and_null(self):
+        rows = [
+            normalize_record(record(1, title='Say "hi", ETH', embedding=[0.5] * 768)),
+            normalize_record(record(2)),
+        ]
+
+        parsed = list(csv.reader(to_csv(rows)))
+
+        self.assertEqual(parsed[0][0], 'Say "hi", ETH')
+        self.assertEqual(parsed[0][4], "[" + ",".join(["0.5"] * 768) + "]")
+        self.assertEqual(parsed[1][4], "")
+
+
+class BulkImportTest(SimpleTestCase):
+
+    @patch('arbitrage_agent.apps.news_articles.bulk_import.transaction.atomic', MagicMock())
+    @patch('arbitrage_agent.apps.news_articles.bulk_import.connection')
+    def test_copies_chunks_then_inserts_once_and_rebuilds_vector_indexes(self, mock_connection: MagicMock):
+        cursor = mock_connection.cursor.return_value.__enter__.return_value
+        index_definition = "CREATE INDEX news_hnsw ON news_articles_newsarticle USING hnsw (embedding)"
+        cursor.fetchall.return_value = [("news_hnsw", index_definition)]
+        cursor.rowcount = 4
+        embeddings_model = MagicMock()
+        embeddings_model.embed_documents.side_effect = lambda texts: [[0.1] * 768 for _ in texts]
+
+        records = [record(1, embedding=[0.2] * 768)] + [record(n) for n in range(2, 6)] + [record(6, url=None)]
+        stats = bulk_import(records, embeddings_model=embeddings_model, chunk_size=2)
+
+        self.assertEqual(cursor.copy_expert.call_count, 3)
+        # Only the records without a precomputed vector are embedded
+        embedded = [text for call in embeddings_model.embed_documents.call_args_list for text in call.args[0]]
+        self.assertEqual(len(embedded), 4)
+        self.assertEqual((stats.read, stats.skipped, stats.staged, stats.inserted), (6, 1, 5, 4))
+
+        statements = [call.args[0] for call in cursor.execute.call_args_list]
+        insert_index = next(i for i, sql in enumerate(statements) if sql.startswith("INSERT"))
+        self.assertIn("ON CONFLICT (url) DO NOTHING", statements[insert_index])
+        self.assertEqual(statements[insert_index - 1], 'DROP INDEX "news_hnsw"')
+        self.assertEqual(statements[-1], index_definition)
+
+    @patch('arbitrage_agent.apps.news_articles.bulk_import.transaction.atomic', MagicMock())
+    @patch('arbitrage_agent.apps.news_articles.bulk_import.connection')
+    def test_embedding_failure_keeps_the_import_going(self, mock_connection: MagicMock):
+        cursor = mock_connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = []
+        cursor.rowcount = 4
+        embeddings_model = MagicMock()
+        embeddings_model.embed_documents.side_effect = [RuntimeError("quota exceeded"), [[0.1] * 768] * 2]
+
+        records = [record(n) for n in range(1, 5)]
+        with self.assertLogs("arbitrage_agent.apps.news_articles.bulk_import", level="WARNING"):
+            stats = bulk_import(records, embeddings_model=embeddings_model, chunk_size=2)
+
+        # The failed chunk is still staged, without embeddings
+        self.assertEqual(cursor.copy_expert.call_count, 2)
+        failed_chunk = list(csv.reader(cursor.copy_expert.call_args_list[0].args[1]))
+        self.assertEqual([row[4] for row in failed_chunk], ["", ""])
+        self.assertEqual((stats.staged, stats.unembedded, stats.inserted), (4, 2, 4))
@@ -0,0 +1,139 @@
+import json
+
+from django.test import SimpleTestCase
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from arbitrage_agent.core.context import compact_messages, estimate_tokens
+
+
+def search_round(call_id: str, articles: list[dict]) -> list:
+    return [
+        AIMessage(content="", tool_calls=[{"name": "search_internal_news", "args": {"query": "eth"}, "id": call_id}]),
+        ToolMessage(content=json.dumps(articles), tool_call_id=call_id, name="search_internal_news"),
+    ]
+
+
+def article(number: int) -> dict:
+    return {"title": f"News {number}", "summary": "ETH rallies on ETF inflows. " * 40, "url": f"https://x.com/{number}"}
+
+
+class CompactMessagesTest(SimpleTestCase):
+
+    def setUp(self):
+        self.head = [SystemMessage(content="You are a crypto analyst."), HumanMessage(content="Is ETH a buy?")]
+
+    def test_short_history_is_untouched(self):
+        messages = self.head + search_round("call-1", [article(1)])
+        self.assertEqual(compact_messages(messages, token_budget=10_000), messages)
+
+    def test_recent_results_kept_and_older_summaries_shortened(self):
+        messages = (
+            self.head
+            + search_round("call-1", [article(1), article(2)])
+            + search_round("call-2", [article(3)])
+            + search_round("call-3", [article(4)])
+        )
+
+        compacted = compact_messages(messages, token_budget=10_000, keep_recent=2, summary_chars=50)
+
+        self.assertEqual(len(compacted), len(messages))
+        self.assertEqual(compacted[5:], messages[5:])
+        older = json.loads(compacted[3].content)
+        self.assertLess(len(older[0]["summary"]), 100)
+        self.assertEqual(older[1]["url"], "https://x.com/2")
+
+    def test_repeated_retrievals_are_deduplicated(self):
+        messages = (
+            self.head
+            + search_round("call-1", [article(1), article(2)])
+            + search_round("call-2", [article(2), article(3)])
+            + search_round("call-3", [article(1), article(2)])
+            + search_round("call-4", [article(5)])
+        )
+
+        compacted = compact_messages(messages, token_budget=10_000, keep_recent=1)
+
+        # Identical payload: the older copy points at the newest one
+        self.assertEqual(compacted[3].content, "[Same result as tool call call-3 below, omitted]")
+        # An article already shown by an earlier result is replaced by a reference
+        surviving = json.loads(compacted[7].content)
+        self.assertEqual(surviving[0]["url"], "https://x.com/1")
+        self.assertEqual(surviving[1], {"url": "https://x.com/2", "note": "already retrieved above"})
+
+    def test_budget_is_enforced_on_older_results(self):
+        messages = self.head
+        for number in range(6):
+            messages = messages + search_round(f"call-{number}", [article(number)])
+
+        compacted = compact_messages(messages, token_budget=500, keep_recent=1, summary_chars=1000)
+
+        self.assertLessEqual(estimate_tokens(compacted), 500)
+        self.assertIn("omitted to fit the context budget", compacted[3].content)
+        # Every tool call still has its response
+        self.assertEqual(
+            [message.tool_call_id for message in compacted if isinstance(message, ToolMessage)],
+            [f"call-{number}" for number in range(6)],
+        )
+        # The newest result is cut last and only as far as the budget requires
+        self.assertTrue(messages[-1].content.startswith(compacted[-1].content.split("... [truncated")[0]))
+
+    def test_budget_applies_to_recent_results(self):
+        messages = self.head
+        for number in range(6):
+            messages = messages + search_round(f"call-{number}", [article(3 * number + i) for i in range(3)])
+
+        compacted = compact_messages(messages, token_budget=1200, keep_recent=2)
+
+        self.assertLessEqual(estimate_tokens(compacted), 1200)
+        self.assertEqual(compacted[:2], self.head)
+        # Once older results are stubbed, the recent ones are truncated oldest first
+        self.assertIn("[truncated", compacted[-3].content)
+        self.assertEqual(len(compacted), len(messages))
+
+    def test_duplicate_of_omitted_result_is_not_referenced(self):
+        messages = (
+            self.head
+            + search_round("call-1", [article(1), article(2)])
+            + search_round("call-2", [article(1), article(2)])
+            + search_round("call-3", [article(3)])
+            + search_round("call-4", [article(4)])
+        )
+
+        compacted = compact_messages(messages, token_budget=300, keep_recent=1)
+
+        self.assertLessEqual(estimate_tokens(compacted), 300)
+        # call-2 survived deduplication but was stubbed by the budget, so call-1 must not point at it
+        self.assertIn("omitted to fit the context budget", compacted[5].content)
+        self.assertNotIn("call-2", compacted[3].content)
+
+    def test_reference_to_omitted_article_is_not_left_dangling(self):
+        messages = (
+            self.head
+            + search_round("call-1", [article(1), article(2)])
+            + search_round("call-2", [article(1), article(3)])
+            + search_round("call-3", [article(4)])
+            + search_round("call-4", [article(5)])
+        )
+
+        compacted = compact_messages(messages, token_budget=850)
+
+        self.assertLessEqual(estimate_tokens(compacted), 850)
+        self.assertIn("omitted to fit the context budget", compacted[3].content)
+        # call-1 held the only full copy of article 1, so call-2 must not point back at it
+        second = json.loads(compacted[5].content)
+        self.assertEqual(second[0], {"url": "https://x.com/1", "note": "omitted to fit the context budget"})
+        self.assertEqual(second[1]["url"], "https://x.com/3")
+
+    def test_list_content_keeps_non_text_parts(self):
+        signature = {"type": "thinking", "signature": "c2lnbmF0dXJl", "extras": {"signature": "c2lnbmF0dXJl"}}
+        answer = AIMessage(content=[signature, {"type": "text", "text": "ETH looks strong. " * 200}])
+        messages = self.head + [answer, HumanMessage(content="And BTC?")]
+
+        compacted = compact_messages(messages, token_budget=300)
+
+        self.assertLessEqual(estimate_tokens(compacted), 300)
+        content = compacted[2].content
+        self.assertIsInstance(content, list)
+        self.assertEqual(content[0], signature)
+        self.assertTrue(content[1]["text"].startswith("ETH looks strong."))
+        self.assertIn("[truncated", content[1]["text"])
@@ -0,0 +1,40 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from arbitrage_agent.apps.news_articles.bulk_import import normalize_record
+from arbitrage_agent.apps.news_articles.corpus import BLOCK_SIZE, iter_synthetic_articles, make_centroids
+
+
+def parse_vector(literal: str) -> np.ndarray:
+    return np.array([float(value) for value in literal.strip("[]").split(",")])
+
+
+class SyntheticCorpusTest(SimpleTestCase):
+
+    def setUp(self):
+        self.centroids = make_centroids(seed=7, clusters=8)
+
+    def generate(self, start: int, stop: int) -> list[dict]:
+        return list(iter_synthetic_articles(start, stop, seed=7, centroids=self.centroids, noise=0.6))
+
+    def test_rows_do_not_depend_on_how_the_range_is_split(self):
+        whole = self.generate(BLOCK_SIZE - 5, BLOCK_SIZE + 5)
+        pieces = self.generate(BLOCK_SIZE - 5, BLOCK_SIZE - 2) + self.generate(BLOCK_SIZE - 2, BLOCK_SIZE + 5)
+
+        self.assertEqual(whole, pieces)
+        self.assertEqual(len({record["url"] for record in whole}), 10)
+
+    def test_embeddings_are_clustered_unit_vectors(self):
+        vectors = np.array([parse_vector(record["embedding"]) for record in self.generate(0, 200)])
+
+        np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1, atol=1e-4)
+        # Every article sits much closer to one centroid than random vectors would
+        similarity = vectors @ self.centroids.T
+        self.assertGreater(similarity.max(axis=1).min(), 0.7)
+        self.assertLess(np.abs(np.sort(similarity, axis=1)[:, -2]).max(), 0.3)
+
+    def test_records_are_importable(self):
+        for record in self.generate(0, 5):
+            row = normalize_record(record)
+            self.assertIsNotNone(row)
+            self.assertEqual(row["embedding"], record["embedding"])
@@ -0,0 +1,200 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+from rq.exceptions import NoSuchJobError
+from rq.job import JobStatus
+
+from arbitrage_agent.core import connections
+from arbitrage_agent.core.jobs import (
+    get_dedupe_key,
+    normalize_query,
+    on_analysis_success,
+    submit_analysis,
+)
+
+
+class DedupeKeyTest(SimpleTestCase):
+
+    def test_normalize_query(self):
+        self.assertEqual(normalize_query("  Is ETH   a good\tBUY? "), "is eth a good buy?")
+
+    def test_equivalent_queries_share_key(self):
+        self.assertEqual(get_dedupe_key("Is ETH a good buy?"), get_dedupe_key("is eth  a good buy?"))
+
+    def test_idempotency_key_changes_key(self):
+        self.assertNotEqual(
+            get_dedupe_key("Is ETH a good buy?"),
+            get_dedupe_key("Is ETH a good buy?", idempotency_key="client-1"),
+        )
+
+
+@override_settings(ANALYSIS_DEDUPE_WINDOW=60, ANALYSIS_DEDUPE_INFLIGHT_TTL=600)
+class SubmitAnalysisTest(SimpleTestCase):
+
+    def setUp(self):
+        self.queue = MagicMock()
+        self.connection = self.queue.connection
+        patcher = patch('arbitrage_agent.core.jobs.django_rq.get_queue', return_value=self.queue)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_enqueues_new_job_when_no_duplicate(self):
+        self.connection.get.return_value = None
+        self.connection.set.return_value = True
+        created_job = self.queue.create_job.return_value
+
+        job, created = submit_analysis("Is ETH a good buy?")
+
+        self.assertTrue(created)
+        self.assertEqual(job, self.queue.enqueue_job.return_value)
+        key = get_dedupe_key("Is ETH a good buy?")
+        # The job hash exists before the claim that points at it
+        created_job.save.assert_called_once()
+        self.connection.set.assert_called_once_with(key, created_job.id, nx=True, ex=600)
+        self.queue.enqueue_job.assert_called_once_with(created_job)
+        _, create_kwargs = self.queue.create_job.call_args
+        self.assertEqual(create_kwargs["meta"], {"dedupe_key": key})
+        self.assertEqual(create_kwargs["status"], JobStatus.CREATED)
+
+    @patch('arbitrage_agent.core.jobs.Job')
+    def test_returns_in_flight_job(self, mock_job_cls: MagicMock):
+        self.connection.get.return_value = b"existing-job"
+        existing = mock_job_cls.fetch.return_value
+        existing.is_failed = existing.is_stopped = existing.is_canceled = False
+
+        job, created = submit_analysis("is eth a good buy?")
+
+        self.assertFalse(created)
+        self.assertEqual(job, existing)
+        mock_job_cls.fetch.assert_called_once_with("existing-job", connection=self.connection)
+        self.queue.create_job.assert_not_called()
+
+    @patch('arbitrage_agent.core.jobs._discard_dedupe_key')
+    @patch('arbitrage_agent.core.jobs.Job')
+    def test_failed_job_is_resubmitted(self, mock_job_cls: MagicMock, mock_discard: MagicMock):
+        self.connection.get.return_value = b"failed-job"
+        mock_job_cls.fetch.return_value.is_failed = True
+        self.connection.set.return_value = True
+
+        _, created = submit_analysis("Is ETH a good buy?")
+
+        self.assertTrue(created)
+        mock_discard.assert_called_once_with(self.connection, get_dedupe_key("Is ETH a good buy?"), "failed-job")
+        self.queue.enqueue_job.assert_called_once()
+
+    def test_success_callback_shrinks_ttl_to_window(self):
+        job = MagicMock(meta={"dedupe_key": "analysis:dedupe:abc"})
+        connection = MagicMock()
+
+        on_analysis_success(job, connection, "answer")
+
+        connection.expire.assert_called_once_with("analysis:dedupe:abc", 60)
+
+
+@override_settings(ANALYSIS_DEDUPE_WINDOW=60, ANALYSIS_DEDUPE_INFLIGHT_TTL=600)
+class ConcurrentSubmitAnalysisTest(SimpleTestCase):
+    """Two duplicate submissions interleaved step by step against a shared key space and job store."""
+
+    def setUp(self):
+        self.keys: dict[str, bytes] = {}
+        self.saved_jobs: dict[str, MagicMock] = {}
+        self.queue = MagicMock()
+        self.queue.connection.get.side_effect = self.keys.get
+        self.queue.connection.set.side_effect = self.set_key
+        self.queue.create_job.side_effect = self.create_job
+        self.queue.enqueue_job.side_effect = lambda job: job
+
+        patcher = patch('arbitrage_agent.core.jobs.django_rq.get_queue', return_value=self.queue)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        fetch_patcher = patch('arbitrage_agent.core.jobs.Job.fetch', side_effect=self.fetch)
+        fetch_patcher.start()
+        self.addCleanup(fetch_patcher.stop)
+
+    def set_key(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool | None:
+        if nx and key in self.keys:
+            return None
+        self.keys[key] = value.encode()
+        return True
+
+    def create_job(self, func, args, job_id, **kwargs) -> MagicMock:
+        job = MagicMock(id=job_id, is_failed=False, is_stopped=False, is_canceled=False)
+        job.save.side_effect = lambda: self.saved_jobs.setdefault(job_id, job)
+        job.delete.side_effect = lambda: self.saved_jobs.pop(job_id)
+        return job
+
+    def fetch(self, job_id: str, connection) -> MagicMock:
+        if job_id not in self.saved_jobs:
+            raise NoSuchJobError(job_id)
+        return self.saved_jobs[job_id]
+
+    def test_duplicate_between_claim_and_enqueue_attaches_to_winner(self):
+        duplicate = {}
+
+        def enqueue_after_duplicate(job):
+            # B arrives after A's SET NX but before A's enqueue completes
+            if not duplicate:
+                duplicate["result"] = None
+                duplicate["result"] = submit_analysis("is eth a good buy?")
+            return job
+
+        self.queue.enqueue_job.side_effect = enqueue_after_duplicate
+
+        job, created = submit_analysis("Is ETH a good buy?")
+
+        self.assertTrue(created)
+        duplicate_job, duplicate_created = duplicate["result"]
+        self.assertFalse(duplicate_created)
+        self.assertIs(duplicate_job, job)
+        self.assertEqual(self.keys[get_dedupe_key("Is ETH a good buy?")], job.id.encode())
+        self.assertEqual(self.queue.enqueue_job.call_count, 1)
+
+    def test_losing_the_claim_deletes_the_unqueued_job(self):
+        original_get = self.queue.connection.get.side_effect
+        winner = {}
+
+        def get_then_lose(key):
+            value = original_get(key)
+            if not winner:
+                # B reads an empty key, then A claims it before B's SET NX
+                winner["result"] = None
+                winner["result"] = submit_analysis("Is ETH a good buy?")
+            return value
+
+        self.queue.connection.get.side_effect = get_then_lose
+
+        job, created = submit_analysis("Is ETH a good buy?")
+
+        winner_job, winner_created = winner["result"]
+        self.assertTrue(winner_created)
+        self.assertFalse(created)
+        self.assertIs(job, winner_job)
+        self.assertEqual(list(self.saved_jobs), [winner_job.id])
+        self.assertEqual(self.queue.enqueue_job.call_count, 1)
+
+
+class AsyncRedisPoolTest(SimpleTestCase):
+
+    @patch('arbitrage_agent.core.connections.aioredis.BlockingConnectionPool.from_url')
+    def test_pool_is_shared_per_loop_and_disconnected_when_the_loop_ends(self, mock_from_url: MagicMock):
+        pools = []
+
+        def make_pool(*args, **kwargs):
+            pools.append(MagicMock(disconnect=AsyncMock()))
+            return pools[-1]
+        mock_from_url.side_effect = make_pool
+
+        async def request():
+            first, second = connections.get_async_redis(), connections.get_async_redis()
+            return first.connection_pool, second.connection_pool
+
+        # Like runserver, which runs every async view in its own event loop
+        for _ in range(2):
+            first, second = asyncio.run(request())
+            self.assertIs(first, second)
+
+        self.assertEqual(len(pools), 2)
+        for pool in pools:
+            pool.disconnect.assert_awaited_once()
+        self.assertEqual(connections._async_pools, {})
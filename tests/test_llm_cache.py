@@ -0,0 +1,124 @@
+import json
+from unittest.mock import MagicMock
+
+from django.test import SimpleTestCase
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage, message_to_dict
+from langchain_core.tools import tool
+from redis.exceptions import ConnectionError
+
+from arbitrage_agent.core.llm_cache import INDEX_KEY, STATS_KEY, LLMCache
+
+
+@tool
+def lookup(ticker: str) -> str:
+    """Look up a ticker."""
+    return ticker
+
+
+@tool
+def other_lookup(ticker: str) -> str:
+    """Look up a ticker elsewhere."""
+    return ticker
+
+
+def history(call_id: str, message_id: str) -> list:
+    return [
+        SystemMessage(content="You are a crypto analyst."),
+        HumanMessage(content="Is ETH a buy?"),
+        AIMessage(
+            id=message_id,
+            content="",
+            tool_calls=[{"name": "lookup", "args": {"ticker": "ETH"}, "id": call_id}],
+            response_metadata={"finish_reason": "STOP"},
+        ),
+        ToolMessage(content="3500", tool_call_id=call_id, name="lookup"),
+    ]
+
+
+class LLMCacheTest(SimpleTestCase):
+
+    def setUp(self):
+        self.connection = MagicMock()
+        self.pipe = self.connection.pipeline.return_value.__enter__.return_value
+        self.cache = LLMCache(self.connection, "gemini-2.5-flash", [lookup], ttl=60, max_entries=2)
+        self.model = MagicMock()
+
+    def test_key_ignores_run_specific_ids(self):
+        self.assertEqual(
+            self.cache.make_key(history("uuid-1", "run-1")),
+            self.cache.make_key(history("uuid-2", "run-2")),
+        )
+
+        other_tools = LLMCache(self.connection, "gemini-2.5-flash", [other_lookup])
+        other_model = LLMCache(self.connection, "gemini-2.5-pro", [lookup])
+        key = self.cache.make_key(history("uuid-1", "run-1"))
+        self.assertNotEqual(other_tools.make_key(history("uuid-1", "run-1")), key)
+        self.assertNotEqual(other_model.make_key(history("uuid-1", "run-1")), key)
+
+    def test_miss_calls_model_and_stores_response(self):
+        response = AIMessage(content="", tool_calls=[{"name": "lookup", "args": {"ticker": "BTC"}, "id": "uuid-9"}])
+        self.model.invoke.return_value = response
+        self.pipe.execute.side_effect = [[None, 0, 0], [1], [True, 1, 0, 1]]
+
+        self.assertIs(self.cache.invoke(self.model, history("uuid-1", "run-1")), response)
+
+        self.model.invoke.assert_called_once()
+        key = self.cache.make_key(history("uuid-1", "run-1"))
+        self.pipe.set.assert_called_once_with(key, json.dumps(message_to_dict(response)), ex=60)
+        self.pipe.hincrby.assert_called_once_with(STATS_KEY, "misses", 1)
+        self.connection.zpopmin.assert_not_called()
+
+    def test_hit_replays_tool_calls_with_fresh_ids(self):
+        cached = AIMessage(
+            content="",
+            tool_calls=[{"name": "lookup", "args": {"ticker": "BTC"}, "id": "uuid-9"}],
+            usage_metadata={"input_tokens": 90, "output_tokens": 10, "total_tokens": 100},
+        )
+        self.pipe.execute.side_effect = [[json.dumps(message_to_dict(cached)).encode(), 1, 1], [1, 100]]
+
+        response = self.cache.invoke(self.model, history("uuid-1", "run-1"))
+
+        self.model.invoke.assert_not_called()
+        self.assertEqual(response.tool_calls[0]["name"], "lookup")
+        self.assertEqual(response.tool_calls[0]["args"], {"ticker": "BTC"})
+        self.assertNotEqual(response.tool_calls[0]["id"], "uuid-9")
+        self.assertTrue(response.response_metadata["llm_cache_hit"])
+        key = self.cache.make_key(history("uuid-1", "run-1"))
+        self.pipe.expire.assert_called_once_with(key, 60)
+        self.pipe.hincrby.assert_any_call(STATS_KEY, "hits", 1)
+        self.pipe.hincrby.assert_any_call(STATS_KEY, "tokens_saved", 100)
+
+    def test_miss_drops_stale_index_member(self):
+        self.model.invoke.return_value = AIMessage(content="")
+        self.pipe.execute.side_effect = [[None, 0, 1], [1]]
+
+        self.cache.invoke(self.model, history("uuid-1", "run-1"))
+
+        self.connection.zrem.assert_called_once_with(INDEX_KEY, self.cache.make_key(history("uuid-1", "run-1")))
+
+    def test_evicts_least_recently_used_beyond_max_entries(self):
+        self.model.invoke.return_value = AIMessage(content="ETH looks strong.")
+        self.pipe.execute.side_effect = [[None, 0, 0], [1], [True, 1, 0, 4]]
+        self.connection.zpopmin.return_value = [(b"llm_cache:entry:a", 1.0), (b"llm_cache:entry:b", 2.0)]
+
+        self.cache.invoke(self.model, history("uuid-1", "run-1"))
+
+        self.connection.zpopmin.assert_called_once_with(INDEX_KEY, 2)
+        self.connection.delete.assert_called_once_with(b"llm_cache:entry:a", b"llm_cache:entry:b")
+
+    def test_empty_responses_are_not_cached(self):
+        self.model.invoke.return_value = AIMessage(content="")
+        self.pipe.execute.side_effect = [[None, 0, 0], [1]]
+
+        self.cache.invoke(self.model, history("uuid-1", "run-1"))
+
+        self.pipe.set.assert_not_called()
+
+    def test_falls_back_to_model_when_redis_is_down(self):
+        self.pipe.execute.side_effect = ConnectionError("down")
+        self.model.invoke.return_value = AIMessage(content="ETH looks strong.")
+
+        with self.assertLogs("arbitrage_agent.core.llm_cache", level="WARNING"):
+            response = self.cache.invoke(self.model, history("uuid-1", "run-1"))
+
+        self.assertEqual(response.content, "ETH looks strong.")
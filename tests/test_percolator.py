@@ -0,0 +1,68 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from arbitrage_agent.apps.news_articles.models import NewsArticle, StandingQuery
+from arbitrage_agent.apps.news_articles.percolator import percolate_articles, score_articles
+
+
+def unit(*components: float) -> list[float]:
+    vector = np.zeros(768, dtype=np.float32)
+    vector[:len(components)] = components
+    return vector.tolist()
+
+
+class ScoreArticlesTest(SimpleTestCase):
+
+    def test_pairs_above_per_query_threshold(self):
+        articles = np.array([unit(1, 0), unit(0, 1), unit(1, 1)])
+        queries = np.array([unit(2, 0), unit(0, 3)])
+
+        pairs, scores = score_articles(articles, queries, np.array([0.9, 0.5]))
+
+        self.assertEqual(pairs.tolist(), [[0, 0], [1, 1], [2, 1]])
+        self.assertAlmostEqual(scores[2, 0], np.sqrt(0.5), places=5)
+
+
+class PercolateArticlesTest(SimpleTestCase):
+
+    def setUp(self):
+        self.btc_query = StandingQuery(pk=1, query="Bitcoin ETF flows", embedding=unit(1, 0), threshold=0.8)
+        self.sol_query = StandingQuery(pk=2, query="Solana upgrades", embedding=unit(0, 1), threshold=0.8)
+        self.articles = [
+            NewsArticle(pk=10, title="BTC ETF inflows", url="https://x.com/10", embedding=unit(1, 0.1)),
+            NewsArticle(pk=11, title="Fed holds rates", url="https://x.com/11", embedding=unit(0.5, -1)),
+            NewsArticle(pk=12, title="Spot BTC ETF record", url="https://x.com/12", embedding=unit(0.9, 0)),
+        ]
+
+    @patch('arbitrage_agent.apps.news_articles.percolator.StandingQueryMatch')
+    @patch('arbitrage_agent.apps.news_articles.percolator.django_rq.get_queue')
+    @patch('arbitrage_agent.apps.news_articles.percolator.StandingQuery')
+    def test_one_job_per_matching_query(
+        self, mock_standing_query: MagicMock, mock_get_queue: MagicMock, mock_match: MagicMock
+    ):
+        mock_standing_query.objects.filter.return_value = [self.btc_query, self.sol_query]
+        queue = mock_get_queue.return_value
+        queue.enqueue.return_value.id = "job-1"
+
+        enqueued = percolate_articles(self.articles)
+
+        self.assertEqual(enqueued, 1)
+        queue.enqueue.assert_called_once()
+        prompt = queue.enqueue.call_args[0][1]
+        self.assertIn("Bitcoin ETF flows", prompt)
+        self.assertIn("BTC ETF inflows", prompt)
+        self.assertIn("Spot BTC ETF record", prompt)
+        self.assertNotIn("Fed holds rates", prompt)
+
+        matches = mock_match.objects.bulk_create.call_args[0][0]
+        self.assertEqual(len(matches), 2)
+
+    @patch('arbitrage_agent.apps.news_articles.percolator.django_rq.get_queue')
+    @patch('arbitrage_agent.apps.news_articles.percolator.StandingQuery')
+    def test_no_standing_queries(self, mock_standing_query: MagicMock, mock_get_queue: MagicMock):
+        mock_standing_query.objects.filter.return_value = []
+
+        self.assertEqual(percolate_articles(self.articles), 0)
+        mock_get_queue.assert_not_called()
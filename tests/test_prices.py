@@ -0,0 +1,125 @@
+import json
+import multiprocessing
+import os
+import time
+from unittest.mock import patch
+
+import numpy as np
+from django.test import SimpleTestCase, override_settings
+
+from arbitrage_agent.core.prices import (
+    AGGREGATE_SOURCE,
+    PriceHistory,
+    PriceRingBuffer,
+    PriceSampler,
+    build_bars,
+    compute_spread_stats,
+    get_window_stats,
+)
+from arbitrage_agent.core.tools import get_price_stats
+
+
+def _append_in_child(buffer: PriceRingBuffer) -> None:
+    buffer.append(42.0, 99.5)
+
+
+class PriceRingBufferTest(SimpleTestCase):
+
+    def test_wraps_and_keeps_order(self):
+        buffer = PriceRingBuffer(capacity=4)
+        for tick in range(6):
+            buffer.append(float(tick), 100.0 + tick)
+
+        times, prices = buffer.snapshot()
+
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(times.tolist(), [2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(prices.tolist(), [102.0, 103.0, 104.0, 105.0])
+        self.assertEqual(buffer.window(since=4.0)[1].tolist(), [104.0, 105.0])
+
+    def test_forked_processes_share_ticks(self):
+        buffer = PriceRingBuffer(capacity=4)
+        process = multiprocessing.get_context("fork").Process(target=_append_in_child, args=(buffer,))
+        process.start()
+        process.join()
+
+        self.assertEqual(buffer.snapshot()[1].tolist(), [99.5])
+
+
+class PriceSamplerTest(SimpleTestCase):
+
+    @patch('arbitrage_agent.core.prices.fetch_prices', return_value={"BTC": 100.0})
+    def test_sampler_process_writes_shared_history(self, mock_fetch):
+        history = PriceHistory(["BTC"], [], capacity=16)
+        sampler = PriceSampler(history, sample_interval=0.01, flush_interval=3600)
+
+        sampler.start()
+        try:
+            deadline = time.monotonic() + 5
+            while not len(history.get("BTC")) and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            sampler.stop()
+            sampler.join(timeout=5)
+
+        # The ticks were written by another process and are visible here
+        self.assertNotEqual(sampler.pid, os.getpid())
+        self.assertFalse(sampler.is_alive())
+        self.assertEqual(history.get("BTC").snapshot()[1][0], 100.0)
+
+
+class PriceStatsTest(SimpleTestCase):
+
+    def setUp(self):
+        self.history = PriceHistory(["BTC"], ["Coinbase"], capacity=64)
+        for tick in range(10):
+            self.history.record("BTC", AGGREGATE_SOURCE, 1000.0 + tick, 100.0 + tick)
+            # Coinbase trades 20 bps rich on every other tick
+            premium = 1.002 if tick % 2 else 1.0
+            self.history.record("BTC", "Coinbase", 1000.0 + tick, (100.0 + tick) * premium)
+
+    def test_spread_persistence(self):
+        spread = compute_spread_stats(
+            self.history.get("BTC").snapshot(), self.history.get("BTC", "Coinbase").snapshot(), threshold_bps=10
+        )
+        self.assertEqual(spread["samples"], 10)
+        self.assertAlmostEqual(spread["persistence"], 0.5)
+        self.assertAlmostEqual(spread["last_bps"], 20, places=3)
+
+    @override_settings(PRICE_SPREAD_THRESHOLD_BPS=10)
+    def test_window_stats(self):
+        stats = get_window_stats(self.history, "btc", window_seconds=5, now=1009.0)
+
+        self.assertEqual(stats["ticks"], 6)
+        self.assertAlmostEqual(stats["return_pct"], (109 / 104 - 1) * 100)
+        self.assertEqual(stats["high"], 109.0)
+        self.assertIn("Coinbase", stats["spreads"])
+        self.assertIsNone(get_window_stats(self.history, "DOGE", window_seconds=5))
+
+    def test_build_bars(self):
+        times = np.array([0.0, 30.0, 59.0, 60.0, 90.0, 130.0])
+        prices = np.array([10.0, 12.0, 11.0, 11.5, 9.0, 10.0])
+
+        bars = build_bars(times, prices, resolution=60)
+
+        self.assertEqual([bar["bucket_start"] for bar in bars], [0.0, 60.0, 120.0])
+        self.assertEqual(bars[0], {
+            "bucket_start": 0.0, "open": 10.0, "high": 12.0, "low": 10.0, "close": 11.0, "tick_count": 3
+        })
+        self.assertEqual(bars[1]["low"], 9.0)
+        # Only buckets still open after the last flush, and only complete ones
+        self.assertEqual(len(build_bars(times, prices, resolution=60, since=100)), 2)
+        self.assertEqual(len(build_bars(times, prices, resolution=60, complete_from=30)), 2)
+
+
+class GetPriceStatsToolTest(SimpleTestCase):
+
+    @override_settings(PRICE_SPREAD_THRESHOLD_BPS=10)
+    @patch('arbitrage_agent.core.tools.get_window_stats')
+    def test_returns_json_stats(self, mock_stats):
+        mock_stats.return_value = {"asset": "BTC", "return_pct": 1.5, "spreads": {}}
+
+        result = get_price_stats.invoke({"ticker": "BTC", "window_minutes": 30})
+
+        self.assertEqual(json.loads(result)["return_pct"], 1.5)
+        self.assertEqual(mock_stats.call_args[0][2], 1800)
@@ -0,0 +1,23 @@
+import pickle
+
+from django.test import SimpleTestCase
+
+from arbitrage_agent.core.serializers import CompactSerializer
+
+
+class CompactSerializerTest(SimpleTestCase):
+
+    def test_round_trip(self):
+        job_data = ("arbitrage_agent.core.logic.ask_agent", None, ["Is ETH a good buy?"], {})
+        loaded = CompactSerializer.loads(CompactSerializer.dumps(job_data))
+        # msgpack has no tuple type; RQ only unpacks the payload so a list is equivalent
+        self.assertEqual(loaded, list(job_data[:2]) + [["Is ETH a good buy?"], {}])
+
+    def test_smaller_than_pickle_for_answers(self):
+        answer = "Bitcoin shows a bullish trend after the ETF approvals. " * 40
+        self.assertLess(len(CompactSerializer.dumps(answer)), len(pickle.dumps(answer)) / 5)
+
+    def test_reads_pickled_payloads(self):
+        # Jobs enqueued by `rq cron` still use RQ's default pickle serializer
+        payload = pickle.dumps({"batch_size": 20}, protocol=pickle.HIGHEST_PROTOCOL)
+        self.assertEqual(CompactSerializer.loads(payload), {"batch_size": 20})
@@ -0,0 +1,46 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from arbitrage_agent.apps.transcripts.models import ToolOutput, Transcript
+from arbitrage_agent.apps.transcripts.utils import aget_transcript_page, save_transcript
+
+
+def agent_messages(query: str, news: str) -> list:
+    return [
+        SystemMessage(content="You are a senior crypto analyst."),
+        HumanMessage(content=query),
+        AIMessage(content="", tool_calls=[{"name": "search_internal_news", "args": {"query": query}, "id": "call-1"}]),
+        ToolMessage(content=news, tool_call_id="call-1", name="search_internal_news"),
+        AIMessage(content="ETH looks fairly priced."),
+    ]
+
+
+class SaveTranscriptTest(TestCase):
+
+    def test_tool_outputs_are_deduplicated(self):
+        news = json.dumps([{"title": "Ethereum Merge 2.0", "summary": "New upgrades coming to ETH."}])
+
+        save_transcript("job-1", "Is ETH a good buy?", agent_messages("Is ETH a good buy?", news))
+        save_transcript("job-2", "Should I buy ETH?", agent_messages("Should I buy ETH?", news))
+
+        self.assertEqual(Transcript.objects.count(), 2)
+        self.assertEqual(ToolOutput.objects.count(), 1)
+
+        transcript = Transcript.objects.get(job_id="job-1")
+        self.assertEqual(transcript.answer, "ETH looks fairly priced.")
+        self.assertEqual(transcript.message_count, 5)
+        self.assertEqual(transcript.messages.get(position=2).tool_calls[0]["name"], "search_internal_news")
+
+    async def test_transcript_page(self):
+        news = json.dumps([{"title": "Bitcoin hits $100k"}])
+        await sync_to_async(save_transcript)("job-1", "BTC?", agent_messages("BTC?", news))
+
+        page = await aget_transcript_page("job-1", page=2, page_size=3)
+
+        self.assertEqual(page["total"], 5)
+        self.assertEqual([message["position"] for message in page["messages"]], [3, 4])
+        self.assertEqual(page["messages"][0]["content"], news)
+        self.assertIsNone(await aget_transcript_page("missing", page=1, page_size=3))
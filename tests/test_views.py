@@ -0,0 +1,137 @@
+import zlib
+from base64 import b64encode
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.test import SimpleTestCase
+from langchain_google_genai._common import GoogleGenerativeAIError
+
+from arbitrage_agent.core.jobs import afetch_job_statuses
+from arbitrage_agent.core.serializers import CompactSerializer
+
+
+def result_entry(return_value=None, exc_string=None, type_=1) -> list:
+    """An `XREVRANGE rq:results:<id> + - COUNT 1` reply as RQ writes it."""
+    payload = {b"type": str(type_).encode(), b"worker_name": b"worker"}
+    if return_value is not None:
+        payload[b"return_value"] = b64encode(CompactSerializer.dumps(return_value))
+    if exc_string is not None:
+        payload[b"exc_string"] = b64encode(zlib.compress(exc_string.encode()))
+    return [(b"1700000000000-0", payload)]
+
+
+class FetchJobStatusesTest(SimpleTestCase):
+
+    @patch('arbitrage_agent.core.jobs.get_async_redis')
+    async def test_single_round_trip_for_many_jobs(self, mock_get_redis: MagicMock):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[
+            b"finished", result_entry("Buy the dip."),
+            b"failed", result_entry(exc_string="Traceback: boom", type_=2),
+            b"started", [],
+            None, [],
+        ])
+        mock_get_redis.return_value.pipeline.return_value.__aenter__.return_value = pipe
+
+        statuses = await afetch_job_statuses(["done", "broken", "running", "missing"])
+
+        pipe.execute.assert_awaited_once()
+        self.assertEqual(pipe.hget.call_count, 4)
+        self.assertEqual(statuses["done"], {"status": "completed", "data": "Buy the dip."})
+        self.assertEqual(statuses["broken"], {"status": "failed", "error": "Traceback: boom"})
+        self.assertEqual(statuses["running"], {"status": "started"})
+        self.assertIsNone(statuses["missing"])
+
+
+class TaskStatusViewTest(SimpleTestCase):
+
+    @patch('arbitrage_agent.api.views.afetch_job_statuses', new_callable=AsyncMock)
+    async def test_status_found(self, mock_fetch: AsyncMock):
+        mock_fetch.return_value = {"abc": {"status": "completed", "data": "Answer"}}
+
+        response = await self.async_client.get("/api/status/abc/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "completed", "data": "Answer"})
+
+    @patch('arbitrage_agent.api.views.afetch_job_statuses', new_callable=AsyncMock)
+    async def test_status_not_found(self, mock_fetch: AsyncMock):
+        mock_fetch.return_value = {"abc": None}
+
+        response = await self.async_client.get("/api/status/abc/")
+
+        self.assertEqual(response.status_code, 404)
+
+    @patch('arbitrage_agent.api.views.afetch_job_statuses', new_callable=AsyncMock)
+    async def test_batch_status(self, mock_fetch: AsyncMock):
+        mock_fetch.return_value = {"a": {"status": "queued"}, "b": None}
+
+        response = await self.async_client.get("/api/status/", {"task_ids": "a,b,a"})
+
+        mock_fetch.assert_awaited_once_with(["a", "b"])
+        self.assertEqual(response.json()["results"], {
+            "a": {"status": "queued"},
+            "b": {"status": "error", "message": "Job not found"},
+        })
+
+    async def test_batch_status_requires_ids(self):
+        response = await self.async_client.get("/api/status/")
+        self.assertEqual(response.status_code, 400)
+
+    @patch('arbitrage_agent.api.views.aget_transcript_page', new_callable=AsyncMock)
+    async def test_transcript_page(self, mock_page: AsyncMock):
+        mock_page.return_value = {"task_id": "abc", "page": 2, "page_size": 5, "total": 7, "messages": []}
+
+        response = await self.async_client.get("/api/status/abc/", {"view": "transcript", "page": 2, "page_size": 5})
+
+        mock_page.assert_awaited_once_with("abc", 2, 5)
+        self.assertEqual(response.json()["total"], 7)
+
+    async def test_transcript_page_rejects_bad_page(self):
+        response = await self.async_client.get("/api/status/abc/", {"view": "transcript", "page": "x"})
+        self.assertEqual(response.status_code, 400)
+
+
+class StartAnalysisViewTest(SimpleTestCase):
+
+    async def test_rejects_non_string_query(self):
+        for body in ({"query": 5}, {"query": ["eth"]}, ["Is ETH a buy?"]):
+            response = await self.async_client.post("/api/start/", body, content_type="application/json")
+            self.assertEqual(response.status_code, 400, body)
+
+
+class StandingQueryViewTest(SimpleTestCase):
+
+    @patch('arbitrage_agent.api.views.register_standing_query')
+    async def test_register(self, mock_register: MagicMock):
+        mock_register.return_value = MagicMock(pk=1, query="ETH ETF", threshold=0.8)
+
+        response = await self.async_client.post(
+            "/api/standing-queries/", {"query": "ETH ETF", "threshold": 0.8}, content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 201)
+        mock_register.assert_called_once_with("ETH ETF", 0.8)
+
+    async def test_rejects_invalid_threshold(self):
+        for threshold in ("high", True, 2, [0.5]):
+            response = await self.async_client.post(
+                "/api/standing-queries/", {"query": "ETH ETF", "threshold": threshold}, content_type="application/json"
+            )
+            self.assertEqual(response.status_code, 400, threshold)
+
+    async def test_rejects_non_object_body(self):
+        response = await self.async_client.post(
+            "/api/standing-queries/", ["ETH ETF"], content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    @patch('arbitrage_agent.api.views.register_standing_query')
+    async def test_embedding_failure(self, mock_register: MagicMock):
+        mock_register.side_effect = GoogleGenerativeAIError("quota exceeded")
+
+        with self.assertLogs("arbitrage_agent.api.views", level="ERROR"):
+            response = await self.async_client.post(
+                "/api/standing-queries/", {"query": "ETH ETF"}, content_type="application/json"
+            )
+
+        self.assertEqual(response.status_code, 502)
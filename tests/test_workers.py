@@ -0,0 +1,111 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+from rq.worker import WorkerStatus
+from rq.worker_pool import WorkerData
+
+from arbitrage_agent.core.workers import PreforkWorkerPool, QueueDepthScaler
+
+
+def fake_redis(depths: dict[str, int]) -> MagicMock:
+    """Redis stand-in that only answers LLEN for RQ queue keys."""
+    connection = MagicMock()
+    connection.llen.side_effect = lambda key: depths.get(key.removeprefix("rq:queue:"), 0)
+    return connection
+
+
+class QueueDepthScalerTest(SimpleTestCase):
+
+    def test_backlog_sums_all_queues(self):
+        scaler = QueueDepthScaler(fake_redis({"high": 3, "low": 4}), ["high", "default", "low"])
+        self.assertEqual(scaler.get_backlog(), 7)
+
+    def test_scales_up_within_bounds(self):
+        connection = fake_redis({"high": 12})
+        scaler = QueueDepthScaler(connection, ["high"], min_workers=1, max_workers=10, jobs_per_worker=5)
+        self.assertEqual(scaler.desired_workers(current=1), 3)
+
+        connection.llen.side_effect = lambda key: 500
+        self.assertEqual(scaler.desired_workers(current=3), 10)
+
+    def test_scales_down_one_step_at_a_time(self):
+        scaler = QueueDepthScaler(fake_redis({}), ["high"], min_workers=2, max_workers=10)
+        self.assertEqual(scaler.desired_workers(current=6), 5)
+        self.assertEqual(scaler.desired_workers(current=2), 2)
+
+    def test_rejects_invalid_bounds(self):
+        with self.assertRaises(ValueError):
+            QueueDepthScaler(fake_redis({}), ["high"], min_workers=5, max_workers=2)
+
+
+class PreforkWorkerPoolTest(SimpleTestCase):
+
+    def setUp(self):
+        self.scaler = MagicMock()
+        self.pool = PreforkWorkerPool(["high"], connection=fake_redis({}), num_workers=3, scaler=self.scaler)
+        self.pool.status = PreforkWorkerPool.Status.STARTED
+        self.pool.worker_dict = {
+            name: WorkerData(name=name, pid=pid, process=MagicMock())
+            for pid, name in enumerate(("a", "b", "c"), start=100)
+        }
+
+        patchers = [
+            patch.object(self.pool, "reap_workers"),
+            patch.object(self.pool, "stop_worker"),
+            patch.object(self.pool, "start_worker"),
+            patch.object(self.pool, "is_busy", return_value=False),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_scale_down_drains_extra_workers(self):
+        self.scaler.desired_workers.return_value = 2
+
+        self.pool.check_workers()
+
+        self.pool.stop_worker.assert_called_once_with(self.pool.worker_dict["c"])
+        self.assertEqual(self.pool.num_workers, 2)
+        self.assertEqual(self.pool.number_of_serving_workers, 2)
+        self.pool.start_worker.assert_not_called()
+
+    def test_scale_down_prefers_idle_workers(self):
+        self.scaler.desired_workers.return_value = 2
+        self.pool.is_busy.side_effect = lambda worker_data: worker_data.name in ("b", "c")
+
+        self.pool.check_workers()
+
+        self.pool.stop_worker.assert_called_once_with(self.pool.worker_dict["a"])
+
+    def test_is_busy_reads_worker_state(self):
+        pool = PreforkWorkerPool(["high"], connection=fake_redis({}), num_workers=1)
+        worker_data = self.pool.worker_dict["a"]
+
+        with patch.object(pool.worker_class, "find_by_key") as mock_find:
+            mock_find.return_value.get_state.return_value = WorkerStatus.BUSY
+            self.assertTrue(pool.is_busy(worker_data))
+            mock_find.assert_called_once_with("rq:worker:a", connection=pool.connection, serializer=pool.serializer)
+
+            # Not registered yet
+            mock_find.return_value = None
+            self.assertFalse(pool.is_busy(worker_data))
+
+    def test_scale_up_forks_missing_workers(self):
+        self.scaler.desired_workers.return_value = 5
+
+        self.pool.check_workers()
+
+        self.assertEqual(self.pool.start_worker.call_count, 2)
+        self.pool.stop_worker.assert_not_called()
+
+    def test_draining_worker_is_not_respawned(self):
+        self.scaler.desired_workers.return_value = 2
+        self.pool.check_workers()
+
+        # The drained worker exits after finishing its job
+        self.pool.handle_dead_worker(self.pool.worker_dict["c"])
+        self.pool.scale_interval = 3600
+        self.pool.check_workers()
+
+        self.pool.start_worker.assert_not_called()
+        self.assertEqual(self.pool.number_of_serving_workers, 2)